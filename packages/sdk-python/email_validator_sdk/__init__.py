@@ -1,6 +1,6 @@
 """Email Validator SDK for Python."""
 
-from .client import EmailValidator
+from .client import EmailValidator, close_shared_session
 from .async_client import AsyncEmailValidator
 from .types import (
     ValidationResult,
@@ -26,6 +26,7 @@ __all__ = [
     # Clients
     "EmailValidator",
     "AsyncEmailValidator",
+    "close_shared_session",
     # Types
     "ValidationResult",
     "BulkValidationResult",
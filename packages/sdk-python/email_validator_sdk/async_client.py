@@ -1,11 +1,22 @@
 """Asynchronous client for Email Validator API."""
 
 import asyncio
-from typing import List, Optional, Dict, Any
+import gzip
+import math
+import time
+from dataclasses import replace
+from typing import List, Mapping, Optional, Dict, Any, Tuple, cast
 
 import aiohttp
+from aiohttp.resolver import AsyncResolver, ThreadedResolver
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None  # type: ignore[assignment]
 
 from .types import (
+    Deliverability,
     ValidationResult,
     BulkValidationResult,
     HealthCheckResult,
@@ -19,12 +30,71 @@ from .exceptions import (
     NetworkError,
     SDKTimeoutError,
 )
-from .utils import get_backoff_delay, is_retryable_status, is_valid_email_format
+from .utils import (
+    GZIP_MIN_EMAILS,
+    MAX_BACKOFF_DELAY,
+    Endpoints,
+    TTLCache,
+    build_headers,
+    get_backoff_delay,
+    is_retryable_status,
+    is_valid_email_format,
+    is_valid_email_format_fast,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+)
+
+try:
+    import aiodns  # type: ignore[import-not-found]  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    _Resolver: Any = ThreadedResolver
+else:
+    _Resolver = AsyncResolver
+
+# Cap cached DNS answers at five minutes so failovers are still picked up.
+_DNS_CACHE_TTL = 300
+
+# Validation cache key: lower-cased email plus the option flags.
+_CacheKey = Tuple[str, Optional[Tuple[bool, bool, bool, bool]]]
+
+# Results that are stable enough to serve from the validation cache.
+_CACHEABLE = (Deliverability.DELIVERABLE, Deliverability.UNDELIVERABLE)
+
+# Shortest timeout given to an attempt when the call budget is nearly spent.
+_MIN_ATTEMPT_TIMEOUT = 0.05
+
+# Largest list the API accepts in a single bulk request.
+MAX_BULK_SIZE = 1000
+
+# Bulk responses at least this large are parsed off the event loop.
+_OFFLOAD_PARSE_MIN_BYTES = 64 * 1024
+
+
+def _parse_bulk_response(content: bytes) -> BulkValidationResult:
+    """Decode a bulk response body into a BulkValidationResult."""
+    return BulkValidationResult.from_dict(json_loads(content))
+
+
+def _create_connector(**kwargs: Any) -> aiohttp.TCPConnector:
+    """Create a keep-alive TCP connector with DNS caching for the API host."""
+    options: Dict[str, Any] = {
+        "use_dns_cache": True,
+        "ttl_dns_cache": _DNS_CACHE_TTL,
+        "limit": 100,
+        "limit_per_host": 32,
+        "keepalive_timeout": 75,
+    }
+    options.update(kwargs)
+    options.setdefault("resolver", _Resolver())
+    return aiohttp.TCPConnector(**options)
 
 
 class AsyncEmailValidator:
     """Asynchronous client for Email Validator API."""
 
+    _shared_connector: Optional[aiohttp.TCPConnector] = None
+
     def __init__(
         self,
         base_url: str,
@@ -32,6 +102,11 @@ class AsyncEmailValidator:
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        total_timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 10_000,
+        compress_requests: bool = False,
+        http2: bool = False,
     ):
         """
         Initialize async Email Validator client.
@@ -42,34 +117,111 @@ class AsyncEmailValidator:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             retry_delay: Initial retry delay in seconds
+            total_timeout: Overall time budget in seconds for a call, including
+                retries and backoff (default ``timeout * (max_retries + 1)``)
+            cache_ttl: Seconds to reuse definitive single-email results for;
+                caching is disabled when None
+            cache_size: Maximum number of cached results
+            compress_requests: Gzip large bulk request bodies; only enable this
+                if the API (or a proxy in front of it) accepts gzip uploads
+            http2: Send requests over a multiplexed HTTP/2 connection using
+                httpx instead of aiohttp (requires the ``http2`` extra)
         """
+        if http2 and httpx is None:
+            raise ImportError("http2=True requires httpx: pip install 'email-validator-sdk[http2]'")
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self._timeout_seconds = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.total_timeout = (
+            total_timeout if total_timeout is not None else timeout * (max_retries + 1)
+        )
+        self._cache: Optional[TTLCache[_CacheKey, bytes]] = (
+            TTLCache(cache_size, cache_ttl) if cache_ttl else None
+        )
+        self.compress_requests = compress_requests
+        self._health_cache: Optional[Tuple[str, HealthCheckResult]] = None
+        self.http2 = http2
+        self._headers = build_headers(api_key)
+        self._endpoints = Endpoints.from_base_url(self.base_url)
         self._session: Optional[aiohttp.ClientSession] = None
+        self._http2_client: Optional["httpx.AsyncClient"] = None
+
+    @classmethod
+    def configure_shared_connector(cls, **kwargs: Any) -> aiohttp.TCPConnector:
+        """
+        Share one connection pool between all client instances.
+
+        Sessions created afterwards reuse the shared connector's keep-alive
+        connections instead of opening their own pool. ``close()`` on an
+        instance leaves the shared connector open; release it with
+        :meth:`close_shared_connector`, which must also be awaited before
+        configuring a different one. Must be called from a running event loop.
+
+        Args:
+            **kwargs: Overrides for the ``aiohttp.TCPConnector`` options
+
+        Returns:
+            The shared connector
+
+        Raises:
+            RuntimeError: If an open shared connector is already configured
+        """
+        current = cls._shared_connector
+        if current is not None and not current.closed:
+            # Sessions may still be using it, so it cannot be closed from here
+            raise RuntimeError(
+                "A shared connector is already configured; "
+                "await close_shared_connector() before replacing it"
+            )
+        cls._shared_connector = _create_connector(**kwargs)
+        return cls._shared_connector
+
+    @classmethod
+    async def close_shared_connector(cls) -> None:
+        """Close the shared connector configured by configure_shared_connector."""
+        connector = cls._shared_connector
+        cls._shared_connector = None
+        if connector is not None and not connector.closed:
+            await connector.close()
+
+    def _get_http2_client(self) -> "httpx.AsyncClient":
+        """Get or create the HTTP/2 httpx client."""
+        if self._http2_client is None or self._http2_client.is_closed:
+            self._http2_client = httpx.AsyncClient(
+                http2=True,
+                headers=self._headers,
+                timeout=httpx.Timeout(self._timeout_seconds),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            )
+        return self._http2_client
 
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create aiohttp session."""
         if self._session is None or self._session.closed:
-            headers = {
-                "Content-Type": "application/json",
-                "User-Agent": "EmailValidator-Python-SDK/1.0.0",
-            }
-            if self.api_key:
-                headers["X-API-Key"] = self.api_key
-            self._session = aiohttp.ClientSession(
-                headers=headers,
-                timeout=self.timeout,
-            )
+            shared = self._shared_connector
+            if shared is not None and not shared.closed:
+                self._session = aiohttp.ClientSession(
+                    headers=self._headers,
+                    timeout=self.timeout,
+                    connector=shared,
+                    connector_owner=False,
+                )
+            else:
+                self._session = aiohttp.ClientSession(
+                    headers=self._headers,
+                    timeout=self.timeout,
+                    connector=_create_connector(),
+                )
         return self._session
 
     async def validate(
         self,
         email: str,
         options: Optional[ValidationOptions] = None,
+        skip_format_check: bool = False,
     ) -> ValidationResult:
         """
         Validate a single email address asynchronously.
@@ -77,6 +229,8 @@ class AsyncEmailValidator:
         Args:
             email: Email address to validate
             options: Optional validation options
+            skip_format_check: Trust the caller's input and leave format
+                checking to the server
 
         Returns:
             ValidationResult with validation details
@@ -84,27 +238,48 @@ class AsyncEmailValidator:
         if not email or not isinstance(email, str):
             raise ValidationError("Email is required")
 
-        if not is_valid_email_format(email):
+        if not skip_format_check and not is_valid_email_format(email):
             raise ValidationError("Invalid email format")
 
-        payload: Dict[str, Any] = {"email": email}
-        if options:
-            payload.update(options.to_dict())
+        if self._cache is not None:
+            cache_key = (email.lower(), options.flags() if options else None)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                # Cache the body, not the result, so callers never share state
+                return ValidationResult.from_dict(json_loads(cached))
+
+        payload: Dict[str, Any] = (
+            {"email": email, **options.as_payload_dict()} if options else {"email": email}
+        )
 
-        response = await self._request("POST", "/api/validate", json=payload)
-        return ValidationResult.from_dict(response)
+        _, _, content = await self._request_raw("POST", self._endpoints.validate, payload)
+        result = ValidationResult.from_dict(json_loads(content))
+        # Only definitive answers are cached; risky/unknown may change on retry
+        if self._cache is not None and result.deliverability in _CACHEABLE:
+            self._cache.set(cache_key, content)
+        return result
 
     async def validate_bulk(
         self,
         emails: List[str],
         options: Optional[ValidationOptions] = None,
+        chunk_size: int = MAX_BULK_SIZE,
+        max_concurrency: int = 8,
+        skip_format_check: bool = False,
     ) -> BulkValidationResult:
         """
         Validate multiple email addresses asynchronously.
 
+        Lists longer than ``chunk_size`` are split into chunks that are sent
+        concurrently and merged into a single result.
+
         Args:
-            emails: List of email addresses (max 1000)
+            emails: List of email addresses
             options: Optional validation options
+            chunk_size: Maximum emails per request (max 1000)
+            max_concurrency: Maximum chunks in flight at once
+            skip_format_check: Skip the client-side format scan for input
+                that has already been validated
 
         Returns:
             BulkValidationResult with all results
@@ -115,15 +290,57 @@ class AsyncEmailValidator:
         if len(emails) == 0:
             raise ValidationError("Emails list cannot be empty")
 
-        if len(emails) > 1000:
-            raise ValidationError("Maximum 1000 emails per request")
+        if not 1 <= chunk_size <= MAX_BULK_SIZE:
+            raise ValidationError(f"chunk_size must be between 1 and {MAX_BULK_SIZE}")
+
+        # Scan once and only collect the offenders if something failed
+        if not skip_format_check and not all(
+            isinstance(e, str) and is_valid_email_format_fast(e) for e in emails
+        ):
+            invalid = [
+                e for e in emails if not isinstance(e, str) or not is_valid_email_format_fast(e)
+            ]
+            raise ValidationError("Invalid email format", details=invalid)
+
+        # Send each address once and fan the results back out afterwards
+        unique = list(dict.fromkeys(emails))
 
-        payload: Dict[str, Any] = {"emails": emails}
-        if options:
-            payload.update(options.to_dict())
+        if len(unique) <= chunk_size:
+            result = await self._validate_bulk_chunk(unique, options)
+        else:
+            semaphore = asyncio.Semaphore(max_concurrency)
 
-        response = await self._request("POST", "/api/validate-bulk", json=payload)
-        return BulkValidationResult.from_dict(response)
+            async def run(chunk: List[str]) -> BulkValidationResult:
+                async with semaphore:
+                    return await self._validate_bulk_chunk(chunk, options)
+
+            chunks = [unique[i : i + chunk_size] for i in range(0, len(unique), chunk_size)]
+            result = BulkValidationResult.merge(await asyncio.gather(*(run(c) for c in chunks)))
+
+        # Line results up with the input whether or not anything was deduped
+        return result.expand_to(emails)
+
+    async def _validate_bulk_chunk(
+        self,
+        emails: List[str],
+        options: Optional[ValidationOptions] = None,
+    ) -> BulkValidationResult:
+        """Validate one request-sized chunk of emails."""
+        payload: Dict[str, Any] = (
+            {"emails": emails, **options.as_payload_dict()} if options else {"emails": emails}
+        )
+
+        _, _, content = await self._request_raw(
+            "POST",
+            self._endpoints.validate_bulk,
+            payload,
+            compress=self.compress_requests and len(emails) >= GZIP_MIN_EMAILS,
+        )
+        if len(content) < _OFFLOAD_PARSE_MIN_BYTES:
+            return _parse_bulk_response(content)
+        # Large responses take milliseconds to materialize; keep the loop free
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _parse_bulk_response, content)
 
     async def health_check(self) -> HealthCheckResult:
         """
@@ -132,80 +349,164 @@ class AsyncEmailValidator:
         Returns:
             HealthCheckResult with status details
         """
-        response = await self._request("GET", "/api/health")
-        return HealthCheckResult(
-            status=response["status"],
-            version=response["version"],
-            uptime=response["uptime"],
-            timestamp=response["timestamp"],
+        # Revalidate the last result with its ETag; a 304 reuses a copy of it
+        cached = self._health_cache
+        headers = {"If-None-Match": cached[0]} if cached else None
+        status, response_headers, content = await self._request_raw(
+            "GET", self._endpoints.health, headers=headers
         )
+        if status == 304 and cached:
+            return replace(cached[1])
+
+        data = json_loads(content)
+        result = HealthCheckResult(
+            status=data["status"],
+            version=data["version"],
+            uptime=data["uptime"],
+            timestamp=data["timestamp"],
+        )
+        etag = response_headers.get("ETag")
+        self._health_cache = (etag, replace(result)) if etag else None
+        return result
 
     async def _request(
         self,
         method: str,
-        endpoint: str,
-        **kwargs: Any,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        compress: bool = False,
     ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        session = await self._get_session()
-        url = f"{self.base_url}{endpoint}"
+        """Make HTTP request with retry logic and decode the JSON response."""
+        _, _, content = await self._request_raw(method, url, payload, headers, compress)
+        return cast(Dict[str, Any], json_loads(content))
+
+    async def _request_raw(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        compress: bool = False,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """
+        Make HTTP request with retry logic and return the successful response.
+
+        With ``compress`` the JSON body is gzipped and sent with
+        ``Content-Encoding: gzip``.
+        """
+        body = json_dumps(payload) if payload is not None else None
+        if compress and body is not None:
+            body = gzip.compress(body, compresslevel=1)
+            headers = {**(headers or {}), "Content-Encoding": "gzip"}
         last_error: Optional[Exception] = None
+        prev_delay: Optional[float] = None
+        deadline = time.monotonic() + self.total_timeout
 
         for attempt in range(self.max_retries + 1):
+            retry_after: Optional[float] = None
+            remaining = max(_MIN_ATTEMPT_TIMEOUT, deadline - time.monotonic())
             try:
-                async with session.request(method, url, **kwargs) as response:
-                    if response.ok:
-                        return await response.json()
+                status, response_headers, content = await asyncio.wait_for(
+                    self._send(method, url, body, headers), timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                last_error = SDKTimeoutError(self._timeout_seconds)
+            except (SDKTimeoutError, NetworkError) as e:
+                last_error = e
+            else:
+                if status < 400:
+                    return status, response_headers, content
 
-                    # Handle specific error codes
-                    if response.status == 401:
-                        raise AuthenticationError()
+                # Handle specific error codes
+                if status == 401:
+                    raise AuthenticationError()
 
-                    if response.status == 429:
-                        retry_after = response.headers.get("Retry-After")
-                        raise RateLimitError(
-                            retry_after=int(retry_after) if retry_after else None
-                        )
+                retry_after = parse_retry_after(response_headers.get("Retry-After"))
 
+                if status == 429:
+                    last_error = RateLimitError(
+                        retry_after=math.ceil(retry_after) if retry_after is not None else None
+                    )
+                    # Give up rather than wait longer than the backoff cap
+                    if attempt >= self.max_retries or (retry_after or 0) > MAX_BACKOFF_DELAY:
+                        raise last_error
+                else:
                     # Parse error response
                     try:
-                        error_data = await response.json()
+                        error_data = json_loads(content)
                     except Exception:
-                        error_data = await response.text()
-
-                    if not is_retryable_status(response.status):
-                        raise EmailValidatorError(
-                            f"API error: {response.status}",
-                            "API_ERROR",
-                            response.status,
-                            error_data,
-                        )
+                        error_data = content.decode("utf-8", "replace")
 
                     last_error = EmailValidatorError(
-                        f"API error: {response.status}",
+                        f"API error: {status}",
                         "API_ERROR",
-                        response.status,
+                        status,
                         error_data,
                     )
-
-            except asyncio.TimeoutError:
-                last_error = SDKTimeoutError(self._timeout_seconds)
-            except aiohttp.ClientError as e:
-                last_error = NetworkError(str(e), e)
-            except (AuthenticationError, RateLimitError):
-                raise
+                    if not is_retryable_status(status):
+                        raise last_error
 
             # Wait before retry (except on last attempt)
             if attempt < self.max_retries:
-                delay = get_backoff_delay(attempt, self.retry_delay)
+                delay = get_backoff_delay(
+                    attempt, self.retry_delay, prev_delay, retry_after=retry_after
+                )
+                prev_delay = delay
+                if deadline - time.monotonic() < delay:
+                    break
                 await asyncio.sleep(delay)
 
         raise last_error or NetworkError("Request failed after retries")
 
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a single request and return its status, headers and body."""
+        if self.http2:
+            return await self._send_http2(method, url, body, headers)
+
+        session = await self._get_session()
+        try:
+            async with session.request(method, url, data=body, headers=headers) as response:
+                return response.status, response.headers, await response.read()
+        except asyncio.TimeoutError:
+            raise SDKTimeoutError(self._timeout_seconds)
+        except aiohttp.ClientError as e:
+            raise NetworkError(str(e), e)
+
+    async def _send_http2(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send a single request over the multiplexed HTTP/2 client."""
+        client = self._get_http2_client()
+        try:
+            response = await client.request(method, url, content=body, headers=headers)
+        except httpx.TimeoutException:
+            raise SDKTimeoutError(self._timeout_seconds)
+        except httpx.TransportError as e:
+            raise NetworkError(str(e), e)
+        return response.status_code, response.headers, response.content
+
+    def clear_cache(self) -> None:
+        """Drop all cached validation results."""
+        if self._cache is not None:
+            self._cache.clear()
+
     async def close(self) -> None:
         """Close the HTTP session."""
         if self._session and not self._session.closed:
             await self._session.close()
+        if self._http2_client is not None and not self._http2_client.is_closed:
+            await self._http2_client.aclose()
 
     async def __aenter__(self) -> "AsyncEmailValidator":
         return self
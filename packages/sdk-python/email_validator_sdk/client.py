@@ -1,11 +1,19 @@
 """Synchronous client for Email Validator API."""
 
-from typing import List, Optional, Dict, Any
+import gzip
+import math
+import os
+import threading
+import time
+from dataclasses import replace
+from typing import List, Optional, Dict, Any, Tuple, cast
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
 
 from .types import (
+    Deliverability,
     ValidationResult,
     BulkValidationResult,
     HealthCheckResult,
@@ -19,7 +27,78 @@ from .exceptions import (
     NetworkError,
     SDKTimeoutError,
 )
-from .utils import get_backoff_delay, is_retryable_status, is_valid_email_format, sleep
+from .utils import (
+    GZIP_MIN_EMAILS,
+    MAX_BACKOFF_DELAY,
+    Endpoints,
+    TTLCache,
+    build_headers,
+    get_backoff_delay,
+    is_retryable_status,
+    is_valid_email_format,
+    is_valid_email_format_fast,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+    sleep,
+)
+
+# Validation cache key: lower-cased email plus the option flags.
+_CacheKey = Tuple[str, Optional[Tuple[bool, bool, bool, bool]]]
+
+# Results that are stable enough to serve from the validation cache.
+_CACHEABLE = (Deliverability.DELIVERABLE, Deliverability.UNDELIVERABLE)
+
+# Shortest timeout given to an attempt when the call budget is nearly spent.
+_MIN_ATTEMPT_TIMEOUT = 0.05
+
+_shared_session: Optional[requests.Session] = None
+_shared_session_lock = threading.Lock()
+
+
+def get_shared_session() -> requests.Session:
+    """
+    Return the process-wide session used by clients with shared_session=True.
+
+    The session is created on first use with a connection pool sized for
+    many concurrent callers. Retries are left to the clients.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            session = requests.Session()
+            session.trust_env = False
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _shared_session = session
+        return _shared_session
+
+
+def close_shared_session() -> None:
+    """
+    Close the process-wide session returned by get_shared_session.
+
+    Its pooled connections are released. Clients created afterwards with
+    shared_session=True get a new session, so call this when the clients
+    using the old one are done, for example at shutdown.
+    """
+    global _shared_session
+    with _shared_session_lock:
+        session = _shared_session
+        _shared_session = None
+    if session is not None:
+        session.close()
+
+
+def _environment_settings(url: str) -> Dict[str, Any]:
+    """Resolve the proxy, CA bundle and netrc settings requests would use for url."""
+    verify = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or True
+    return {
+        "proxies": requests.utils.get_environ_proxies(url),
+        "verify": verify,
+        "auth": requests.utils.get_netrc_auth(url),
+    }
 
 
 class EmailValidator:
@@ -32,6 +111,11 @@ class EmailValidator:
         timeout: float = 30.0,
         max_retries: int = 3,
         retry_delay: float = 1.0,
+        total_timeout: Optional[float] = None,
+        cache_ttl: Optional[float] = None,
+        cache_size: int = 10_000,
+        compress_requests: bool = False,
+        shared_session: bool = False,
     ):
         """
         Initialize Email Validator client.
@@ -42,26 +126,55 @@ class EmailValidator:
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts
             retry_delay: Initial retry delay in seconds
+            total_timeout: Overall time budget in seconds for a call, including
+                retries and backoff (default ``timeout * (max_retries + 1)``)
+            cache_ttl: Seconds to reuse definitive single-email results for;
+                caching is disabled when None
+            cache_size: Maximum number of cached results
+            compress_requests: Gzip large bulk request bodies; only enable this
+                if the API (or a proxy in front of it) accepts gzip uploads
+            shared_session: Use the process-wide pooled session from
+                :func:`get_shared_session` instead of a private one, so
+                connections are reused across client instances
         """
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.retry_delay = retry_delay
-        self._session = requests.Session()
-        self._session.headers.update(
-            {
-                "Content-Type": "application/json",
-                "User-Agent": "EmailValidator-Python-SDK/1.0.0",
-            }
+        self.total_timeout = (
+            total_timeout if total_timeout is not None else timeout * (max_retries + 1)
+        )
+        self._cache: Optional[TTLCache[_CacheKey, bytes]] = (
+            TTLCache(cache_size, cache_ttl) if cache_ttl else None
         )
-        if api_key:
-            self._session.headers["X-API-Key"] = api_key
+        self.compress_requests = compress_requests
+        self._health_cache: Optional[Tuple[str, HealthCheckResult]] = None
+        self._endpoints = Endpoints.from_base_url(self.base_url)
+        # The client only ever talks to base_url, so resolve proxy, CA bundle
+        # and netrc settings from the environment once here rather than on
+        # every request.
+        settings: Dict[str, Any] = {"headers": build_headers(api_key)}
+        settings.update(_environment_settings(self.base_url))
+        self._owns_session = not shared_session
+        if shared_session:
+            # Per-client settings travel with each request on the shared session
+            self._session = get_shared_session()
+            self._request_options = settings
+        else:
+            self._session = requests.Session()
+            self._session.trust_env = False
+            self._session.headers.update(settings["headers"])
+            self._session.proxies.update(settings["proxies"])
+            self._session.verify = settings["verify"]
+            self._session.auth = settings["auth"]
+            self._request_options = {}
 
     def validate(
         self,
         email: str,
         options: Optional[ValidationOptions] = None,
+        skip_format_check: bool = False,
     ) -> ValidationResult:
         """
         Validate a single email address.
@@ -69,6 +182,8 @@ class EmailValidator:
         Args:
             email: Email address to validate
             options: Optional validation options
+            skip_format_check: Trust the caller's input and leave format
+                checking to the server
 
         Returns:
             ValidationResult with validation details
@@ -83,20 +198,32 @@ class EmailValidator:
         if not email or not isinstance(email, str):
             raise ValidationError("Email is required")
 
-        if not is_valid_email_format(email):
+        if not skip_format_check and not is_valid_email_format(email):
             raise ValidationError("Invalid email format")
 
-        payload: Dict[str, Any] = {"email": email}
-        if options:
-            payload.update(options.to_dict())
+        if self._cache is not None:
+            cache_key = (email.lower(), options.flags() if options else None)
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                # Cache the body, not the result, so callers never share state
+                return ValidationResult.from_dict(json_loads(cached))
+
+        payload: Dict[str, Any] = (
+            {"email": email, **options.as_payload_dict()} if options else {"email": email}
+        )
 
-        response = self._request("POST", "/api/validate", json=payload)
-        return ValidationResult.from_dict(response)
+        content = self._request_raw("POST", self._endpoints.validate, payload).content
+        result = ValidationResult.from_dict(json_loads(content))
+        # Only definitive answers are cached; risky/unknown may change on retry
+        if self._cache is not None and result.deliverability in _CACHEABLE:
+            self._cache.set(cache_key, content)
+        return result
 
     def validate_bulk(
         self,
         emails: List[str],
         options: Optional[ValidationOptions] = None,
+        skip_format_check: bool = False,
     ) -> BulkValidationResult:
         """
         Validate multiple email addresses.
@@ -104,6 +231,8 @@ class EmailValidator:
         Args:
             emails: List of email addresses (max 1000)
             options: Optional validation options
+            skip_format_check: Skip the client-side format scan for input
+                that has already been validated
 
         Returns:
             BulkValidationResult with all results
@@ -120,12 +249,30 @@ class EmailValidator:
         if len(emails) > 1000:
             raise ValidationError("Maximum 1000 emails per request")
 
-        payload: Dict[str, Any] = {"emails": emails}
-        if options:
-            payload.update(options.to_dict())
+        # Scan once and only collect the offenders if something failed
+        if not skip_format_check and not all(
+            isinstance(e, str) and is_valid_email_format_fast(e) for e in emails
+        ):
+            invalid = [
+                e for e in emails if not isinstance(e, str) or not is_valid_email_format_fast(e)
+            ]
+            raise ValidationError("Invalid email format", details=invalid)
+
+        # Send each address once and fan the results back out afterwards
+        unique = list(dict.fromkeys(emails))
+        payload: Dict[str, Any] = (
+            {"emails": unique, **options.as_payload_dict()} if options else {"emails": unique}
+        )
 
-        response = self._request("POST", "/api/validate-bulk", json=payload)
-        return BulkValidationResult.from_dict(response)
+        response = self._request(
+            "POST",
+            self._endpoints.validate_bulk,
+            payload,
+            compress=self.compress_requests and len(unique) >= GZIP_MIN_EMAILS,
+        )
+        result = BulkValidationResult.from_dict(response)
+        # Line results up with the input whether or not anything was deduped
+        return result.expand_to(emails)
 
     def health_check(self) -> HealthCheckResult:
         """
@@ -134,84 +281,131 @@ class EmailValidator:
         Returns:
             HealthCheckResult with status details
         """
-        response = self._request("GET", "/api/health")
-        return HealthCheckResult(
-            status=response["status"],
-            version=response["version"],
-            uptime=response["uptime"],
-            timestamp=response["timestamp"],
+        # Revalidate the last result with its ETag; a 304 reuses a copy of it
+        cached = self._health_cache
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._request_raw("GET", self._endpoints.health, headers=headers)
+        if response.status_code == 304 and cached:
+            return replace(cached[1])
+
+        data = json_loads(response.content)
+        result = HealthCheckResult(
+            status=data["status"],
+            version=data["version"],
+            uptime=data["uptime"],
+            timestamp=data["timestamp"],
         )
+        etag = response.headers.get("ETag")
+        self._health_cache = (etag, replace(result)) if etag else None
+        return result
 
     def _request(
         self,
         method: str,
-        endpoint: str,
-        **kwargs: Any,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        compress: bool = False,
     ) -> Dict[str, Any]:
-        """Make HTTP request with retry logic."""
-        url = f"{self.base_url}{endpoint}"
+        """Make HTTP request with retry logic and decode the JSON response."""
+        response = self._request_raw(method, url, payload, headers, compress)
+        return cast(Dict[str, Any], json_loads(response.content))
+
+    def _request_raw(
+        self,
+        method: str,
+        url: str,
+        payload: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        compress: bool = False,
+    ) -> requests.Response:
+        """
+        Make HTTP request with retry logic and return the successful response.
+
+        With ``compress`` the JSON body is gzipped and sent with
+        ``Content-Encoding: gzip``.
+        """
+        kwargs: Dict[str, Any] = dict(self._request_options)
+        if payload is not None:
+            body = json_dumps(payload)
+            if compress:
+                body = gzip.compress(body, compresslevel=1)
+                headers = {**(headers or {}), "Content-Encoding": "gzip"}
+            kwargs["data"] = body
+        if headers:
+            kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
         last_error: Optional[Exception] = None
+        prev_delay: Optional[float] = None
+        deadline = time.monotonic() + self.total_timeout
 
         for attempt in range(self.max_retries + 1):
+            retry_after: Optional[float] = None
+            remaining = max(_MIN_ATTEMPT_TIMEOUT, deadline - time.monotonic())
             try:
                 response = self._session.request(
                     method,
                     url,
-                    timeout=self.timeout,
+                    timeout=min(self.timeout, remaining),
                     **kwargs,
                 )
-
+            except Timeout:
+                last_error = SDKTimeoutError(self.timeout)
+            except RequestException as e:
+                last_error = NetworkError(str(e), e)
+            else:
                 if response.ok:
-                    return response.json()
+                    return response
 
                 # Handle specific error codes
                 if response.status_code == 401:
                     raise AuthenticationError()
 
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
                 if response.status_code == 429:
-                    retry_after = response.headers.get("Retry-After")
-                    raise RateLimitError(
-                        retry_after=int(retry_after) if retry_after else None
+                    last_error = RateLimitError(
+                        retry_after=math.ceil(retry_after) if retry_after is not None else None
                     )
-
-                # Parse error response
-                try:
-                    error_data = response.json()
-                except Exception:
-                    error_data = response.text
-
-                if not is_retryable_status(response.status_code):
-                    raise EmailValidatorError(
+                    # Give up rather than wait longer than the backoff cap
+                    if attempt >= self.max_retries or (retry_after or 0) > MAX_BACKOFF_DELAY:
+                        raise last_error
+                else:
+                    # Parse error response
+                    try:
+                        error_data = json_loads(response.content)
+                    except Exception:
+                        error_data = response.text
+
+                    last_error = EmailValidatorError(
                         f"API error: {response.status_code}",
                         "API_ERROR",
                         response.status_code,
                         error_data,
                     )
-
-                last_error = EmailValidatorError(
-                    f"API error: {response.status_code}",
-                    "API_ERROR",
-                    response.status_code,
-                    error_data,
-                )
-
-            except Timeout:
-                last_error = SDKTimeoutError(self.timeout)
-            except RequestException as e:
-                last_error = NetworkError(str(e), e)
-            except (AuthenticationError, RateLimitError):
-                raise
+                    if not is_retryable_status(response.status_code):
+                        raise last_error
 
             # Wait before retry (except on last attempt)
             if attempt < self.max_retries:
-                delay = get_backoff_delay(attempt, self.retry_delay)
+                delay = get_backoff_delay(
+                    attempt, self.retry_delay, prev_delay, retry_after=retry_after
+                )
+                prev_delay = delay
+                if deadline - time.monotonic() < delay:
+                    break
                 sleep(delay)
 
         raise last_error or NetworkError("Request failed after retries")
 
+    def clear_cache(self) -> None:
+        """Drop all cached validation results."""
+        if self._cache is not None:
+            self._cache.clear()
+
     def close(self) -> None:
-        """Close the HTTP session."""
-        self._session.close()
+        """Close the HTTP session unless it is the shared session."""
+        if self._owns_session:
+            self._session.close()
 
     def __enter__(self) -> "EmailValidator":
         return self
@@ -1,8 +1,16 @@
 """Type definitions for Email Validator SDK."""
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from functools import lru_cache
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+
+# Leaf check results are NamedTuples, which are cheaper to build than
+# dataclasses. Containers stay dataclasses, slotted where supported (3.10+).
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_EMPTY: Dict[str, Any] = {}
 
 
 class Deliverability(str, Enum):
@@ -22,8 +30,12 @@ class RiskLevel(str, Enum):
     HIGH = "high"
 
 
-@dataclass
-class SyntaxCheck:
+# Value -> member tables; indexing a dict is much cheaper than Enum.__call__.
+_DELIVERABILITY_BY_VALUE: Dict[str, Deliverability] = {m.value: m for m in Deliverability}
+_RISK_BY_VALUE: Dict[str, RiskLevel] = {m.value: m for m in RiskLevel}
+
+
+class SyntaxCheck(NamedTuple):
     """Syntax validation result."""
 
     valid: bool
@@ -31,16 +43,14 @@ class SyntaxCheck:
     domain: Optional[str] = None
 
 
-@dataclass
-class DomainCheck:
+class DomainCheck(NamedTuple):
     """Domain validation result."""
 
     valid: bool
     exists: bool
 
 
-@dataclass
-class MXCheck:
+class MXCheck(NamedTuple):
     """MX record validation result."""
 
     valid: bool
@@ -48,39 +58,34 @@ class MXCheck:
     priority: Optional[List[int]] = None
 
 
-@dataclass
-class DisposableCheck:
+class DisposableCheck(NamedTuple):
     """Disposable email check result."""
 
     is_disposable: bool
 
 
-@dataclass
-class RoleBasedCheck:
+class RoleBasedCheck(NamedTuple):
     """Role-based email check result."""
 
     is_role_based: bool
     role: Optional[str] = None
 
 
-@dataclass
-class FreeProviderCheck:
+class FreeProviderCheck(NamedTuple):
     """Free provider check result."""
 
     is_free_provider: bool
     provider: Optional[str] = None
 
 
-@dataclass
-class TypoCheck:
+class TypoCheck(NamedTuple):
     """Typo detection result."""
 
     has_typo: bool
     suggestion: Optional[str] = None
 
 
-@dataclass
-class SMTPCheck:
+class SMTPCheck(NamedTuple):
     """SMTP verification result."""
 
     checked: bool
@@ -89,8 +94,7 @@ class SMTPCheck:
     message: str
 
 
-@dataclass
-class AuthenticationCheck:
+class AuthenticationCheck(NamedTuple):
     """Email authentication check result."""
 
     checked: bool
@@ -100,8 +104,7 @@ class AuthenticationCheck:
     dkim: Dict[str, Any]
 
 
-@dataclass
-class ReputationCheck:
+class ReputationCheck(NamedTuple):
     """Domain reputation check result."""
 
     checked: bool
@@ -109,8 +112,7 @@ class ReputationCheck:
     risk: str
 
 
-@dataclass
-class GravatarCheck:
+class GravatarCheck(NamedTuple):
     """Gravatar check result."""
 
     checked: bool
@@ -118,7 +120,7 @@ class GravatarCheck:
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationChecks:
     """All validation check results."""
 
@@ -135,7 +137,7 @@ class ValidationChecks:
     gravatar: Optional[GravatarCheck] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     """Email validation result."""
 
@@ -151,22 +153,24 @@ class ValidationResult:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
         """Create ValidationResult from API response dict."""
-        checks_data = data.get("checks", {})
-
+        get = (data.get("checks") or _EMPTY).get
+        syntax = get("syntax") or _EMPTY
+        domain = get("domain") or _EMPTY
+        mx = get("mx") or _EMPTY
+        role_based = get("roleBased") or _EMPTY
+        free_provider = get("freeProvider") or _EMPTY
+
+        # Positional construction; fields the SDK does not model are ignored
         checks = ValidationChecks(
-            syntax=SyntaxCheck(**checks_data.get("syntax", {"valid": False})),
-            domain=DomainCheck(**checks_data.get("domain", {"valid": False, "exists": False})),
-            mx=MXCheck(**checks_data.get("mx", {"valid": False, "records": []})),
-            disposable=DisposableCheck(
-                is_disposable=checks_data.get("disposable", {}).get("isDisposable", False)
-            ),
-            role_based=RoleBasedCheck(
-                is_role_based=checks_data.get("roleBased", {}).get("isRoleBased", False),
-                role=checks_data.get("roleBased", {}).get("role"),
+            syntax=SyntaxCheck(
+                syntax.get("valid", False), syntax.get("localPart"), syntax.get("domain")
             ),
+            domain=DomainCheck(domain.get("valid", False), domain.get("exists", False)),
+            mx=MXCheck(mx.get("valid", False), mx.get("records") or [], mx.get("priority")),
+            disposable=DisposableCheck((get("disposable") or _EMPTY).get("isDisposable", False)),
+            role_based=RoleBasedCheck(role_based.get("isRoleBased", False), role_based.get("role")),
             free_provider=FreeProviderCheck(
-                is_free_provider=checks_data.get("freeProvider", {}).get("isFreeProvider", False),
-                provider=checks_data.get("freeProvider", {}).get("provider"),
+                free_provider.get("isFreeProvider", False), free_provider.get("provider")
             ),
         )
 
@@ -174,15 +178,16 @@ class ValidationResult:
             email=data["email"],
             valid=data["valid"],
             score=data["score"],
-            deliverability=Deliverability(data["deliverability"]),
-            risk=RiskLevel(data["risk"]),
+            deliverability=_DELIVERABILITY_BY_VALUE.get(data["deliverability"])
+            or Deliverability(data["deliverability"]),
+            risk=_RISK_BY_VALUE.get(data["risk"]) or RiskLevel(data["risk"]),
             checks=checks,
             suggestions=data.get("suggestions"),
             validated_at=data.get("validatedAt"),
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BulkSummary:
     """Bulk validation summary."""
 
@@ -193,25 +198,76 @@ class BulkSummary:
     unknown: int
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BulkValidationResult:
     """Bulk validation result."""
 
     results: List[ValidationResult]
     summary: BulkSummary
     processing_time: float
+    duplicates: int = 0
+    # Input emails the API returned no result for (e.g. partial responses)
+    missing: List[str] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BulkValidationResult":
         """Create BulkValidationResult from API response dict."""
+        from_dict = ValidationResult.from_dict
         return cls(
-            results=[ValidationResult.from_dict(r) for r in data["results"]],
+            results=[from_dict(r) for r in data["results"]],
             summary=BulkSummary(**data["summary"]),
             processing_time=data["processingTime"],
         )
 
+    @classmethod
+    def merge(cls, parts: List["BulkValidationResult"]) -> "BulkValidationResult":
+        """Combine results of chunked bulk requests into one result."""
+        results: List[ValidationResult] = []
+        for part in parts:
+            results.extend(part.results)
+        return cls(
+            results=results,
+            summary=BulkSummary(
+                total=sum(p.summary.total for p in parts),
+                valid=sum(p.summary.valid for p in parts),
+                invalid=sum(p.summary.invalid for p in parts),
+                risky=sum(p.summary.risky for p in parts),
+                unknown=sum(p.summary.unknown for p in parts),
+            ),
+            processing_time=max(p.processing_time for p in parts),
+            duplicates=sum(p.duplicates for p in parts),
+            missing=[e for p in parts for e in p.missing],
+        )
+
+    def expand_to(self, emails: List[str]) -> "BulkValidationResult":
+        """
+        Map the results back onto the emails that were requested.
+
+        Each input email gets its result in input order, repeated for
+        duplicates. Emails the API returned no result for are listed in
+        ``missing`` instead. The summary still describes the unique emails
+        that were sent, and ``duplicates`` records how many entries were not
+        sent.
+        """
+        by_email = {r.email.lower(): r for r in self.results}
+        results = []
+        missing = []
+        for email in emails:
+            result = by_email.get(email.lower())
+            if result is not None:
+                results.append(result)
+            else:
+                missing.append(email)
+        return BulkValidationResult(
+            results=results,
+            summary=self.summary,
+            processing_time=self.processing_time,
+            duplicates=len(emails) - len(dict.fromkeys(emails)),
+            missing=list(dict.fromkeys(missing)),
+        )
+
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class HealthCheckResult:
     """Health check result."""
 
@@ -221,7 +277,7 @@ class HealthCheckResult:
     timestamp: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationOptions:
     """Options for email validation."""
 
@@ -238,3 +294,29 @@ class ValidationOptions:
             "reputationCheck": self.reputation_check,
             "gravatarCheck": self.gravatar_check,
         }
+
+    def as_payload_dict(self) -> Dict[str, bool]:
+        """
+        Return the API request fields for these options without rebuilding them.
+
+        The returned dict is shared between all options with the same flags
+        and must not be modified; use :meth:`to_dict` for a private copy.
+        """
+        return _options_payload(*self.flags())
+
+    def flags(self) -> Tuple[bool, bool, bool, bool]:
+        """Return the option flags as a hashable tuple."""
+        return (self.smtp_check, self.auth_check, self.reputation_check, self.gravatar_check)
+
+
+@lru_cache(maxsize=None)
+def _options_payload(
+    smtp_check: bool, auth_check: bool, reputation_check: bool, gravatar_check: bool
+) -> Dict[str, bool]:
+    """Build the request fields once per combination of option flags."""
+    return {
+        "smtpCheck": smtp_check,
+        "authCheck": auth_check,
+        "reputationCheck": reputation_check,
+        "gravatarCheck": gravatar_check,
+    }
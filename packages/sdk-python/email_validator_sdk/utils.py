@@ -1,16 +1,98 @@
 """Utility functions for Email Validator SDK."""
 
+import json
 import re
 import random
+import threading
 import time
-from typing import Optional
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Generic, Hashable, NamedTuple, Optional, Tuple, TypeVar
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
 
-def get_backoff_delay(attempt: int, base_delay: float) -> float:
-    """Calculate exponential backoff delay with jitter."""
-    delay = base_delay * (2**attempt)
-    jitter = random.uniform(0, 0.1)
-    return delay + jitter
+_EMAIL_RE = re.compile(r"^[^\s@]+@[^\s@]+\.[^\s@]+\Z")
+
+# Characters matched by ``\s`` within the ASCII range.
+_WS = frozenset(" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+
+USER_AGENT = "EmailValidator-Python-SDK/1.0.0"
+
+
+class Endpoints(NamedTuple):
+    """Absolute URLs of the API endpoints, joined once per client."""
+
+    validate: str
+    validate_bulk: str
+    health: str
+
+    @classmethod
+    def from_base_url(cls, base_url: str) -> "Endpoints":
+        """Build endpoint URLs for a base URL without a trailing slash."""
+        return cls(
+            validate=f"{base_url}/api/validate",
+            validate_bulk=f"{base_url}/api/validate-bulk",
+            health=f"{base_url}/api/health",
+        )
+
+
+def build_headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """Build the headers sent with every request."""
+    headers = {
+        "Content-Type": "application/json",
+        "User-Agent": USER_AGENT,
+    }
+    if api_key:
+        headers["X-API-Key"] = api_key
+    return headers
+
+
+# Bulk requests with at least this many emails are worth gzipping.
+GZIP_MIN_EMAILS = 100
+
+# Upper bound for a single backoff wait, in seconds.
+MAX_BACKOFF_DELAY = 30.0
+
+
+def get_backoff_delay(
+    attempt: int,
+    base_delay: float,
+    prev_delay: Optional[float] = None,
+    cap: float = MAX_BACKOFF_DELAY,
+    retry_after: Optional[float] = None,
+) -> float:
+    """
+    Calculate the next retry delay using decorrelated jitter.
+
+    Each delay is drawn from ``[base_delay, prev_delay * 3]`` and capped,
+    which spreads retries from concurrent clients apart while still growing
+    roughly exponentially. A server-provided ``Retry-After`` wins when given.
+    ``attempt`` is kept for call-site compatibility; the growth is driven by
+    ``prev_delay``.
+    """
+    if retry_after is not None:
+        return retry_after
+    prev = prev_delay or base_delay
+    return min(cap, random.uniform(base_delay, prev * 3))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
 
 
 def is_retryable_status(status_code: Optional[int]) -> bool:
@@ -22,8 +104,83 @@ def is_retryable_status(status_code: Optional[int]) -> bool:
 
 def is_valid_email_format(email: str) -> bool:
     """Basic email format validation."""
-    pattern = r"^[^\s@]+@[^\s@]+\.[^\s@]+$"
-    return bool(re.match(pattern, email))
+    return _EMAIL_RE.match(email) is not None
+
+
+def is_valid_email_format_fast(email: str) -> bool:
+    """
+    Single-pass equivalent of :func:`is_valid_email_format`.
+
+    Uses plain string scans instead of the regex engine, which makes it
+    cheaper on large bulk lists. Non-ASCII input falls back to the regex so
+    Unicode whitespace is handled identically.
+    """
+    if not email.isascii():
+        return is_valid_email_format(email)
+    at = email.find("@")
+    if at <= 0 or email.find("@", at + 1) != -1:
+        return False
+    # The domain needs a dot with at least one character on each side.
+    if "." not in email[at + 2 : -1]:
+        return False
+    return _WS.isdisjoint(email)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize a request payload to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Deserialize a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
 
 
 def sleep(seconds: float) -> None:
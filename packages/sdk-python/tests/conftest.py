@@ -0,0 +1,23 @@
+"""Shared fixtures for the SDK tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def validation_response():
+    """Canonical /api/validate response body for a deliverable address."""
+    return {
+        "email": "test@example.com",
+        "valid": True,
+        "score": 95,
+        "deliverability": "deliverable",
+        "risk": "low",
+        "checks": {
+            "syntax": {"valid": True},
+            "domain": {"valid": True, "exists": True},
+            "mx": {"valid": True, "records": ["mx.example.com"]},
+            "disposable": {"isDisposable": False},
+            "roleBased": {"isRoleBased": False},
+            "freeProvider": {"isFreeProvider": False},
+        },
+    }
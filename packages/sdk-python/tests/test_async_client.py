@@ -1,13 +1,23 @@
 """Tests for asynchronous client."""
 
+import json
+
+import aiohttp
+import httpx
 import pytest
 from aioresponses import aioresponses
+from yarl import URL
 
 from email_validator_sdk import (
     AsyncEmailValidator,
-    ValidationError,
     AuthenticationError,
+    EmailValidatorError,
+    NetworkError,
     RateLimitError,
+    SDKTimeoutError,
+    ValidationError,
+    ValidationResult,
+    async_client,
 )
 
 
@@ -22,25 +32,11 @@ def async_validator():
 
 class TestAsyncValidate:
     @pytest.mark.asyncio
-    async def test_validate_success(self, async_validator):
+    async def test_validate_success(self, async_validator, validation_response):
         with aioresponses() as m:
             m.post(
                 "http://localhost:3000/api/validate",
-                payload={
-                    "email": "test@example.com",
-                    "valid": True,
-                    "score": 95,
-                    "deliverability": "deliverable",
-                    "risk": "low",
-                    "checks": {
-                        "syntax": {"valid": True},
-                        "domain": {"valid": True, "exists": True},
-                        "mx": {"valid": True, "records": ["mx.example.com"]},
-                        "disposable": {"isDisposable": False},
-                        "roleBased": {"isRoleBased": False},
-                        "freeProvider": {"isFreeProvider": False},
-                    },
-                },
+                payload=validation_response,
             )
 
             result = await async_validator.validate("test@example.com")
@@ -62,6 +58,26 @@ class TestAsyncValidate:
             await async_validator.validate("not-an-email")
         await async_validator.close()
 
+    @pytest.mark.asyncio
+    async def test_validate_skip_format_check_still_requires_string(self):
+        async with AsyncEmailValidator(base_url="http://localhost:3000", cache_ttl=60) as client:
+            with pytest.raises(ValidationError):
+                await client.validate(None, skip_format_check=True)
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_independent_copies(self, validation_response):
+        with aioresponses() as m:
+            m.post("http://localhost:3000/api/validate", payload=validation_response)
+            async with AsyncEmailValidator(
+                base_url="http://localhost:3000", cache_ttl=60
+            ) as client:
+                first = await client.validate("test@example.com")
+                first.checks.mx.records.append("evil.example.com")
+                second = await client.validate("TEST@example.com")
+
+        assert second == ValidationResult.from_dict(validation_response)
+        assert second.checks.mx.records is not first.checks.mx.records
+
     @pytest.mark.asyncio
     async def test_validate_unauthorized(self, async_validator):
         with aioresponses() as m:
@@ -116,6 +132,7 @@ class TestAsyncValidateBulk:
             result = await async_validator.validate_bulk(["a@b.com", "c@d.com"])
 
             assert result.summary.total == 2
+            assert result.missing == ["a@b.com", "c@d.com"]
 
         await async_validator.close()
 
@@ -126,10 +143,70 @@ class TestAsyncValidateBulk:
         await async_validator.close()
 
     @pytest.mark.asyncio
-    async def test_bulk_validate_too_many(self, async_validator):
-        emails = ["test@example.com"] * 1001
+    async def test_bulk_validate_chunks_large_lists(self, async_validator):
+        emails = [f"user{i}@example.com" for i in range(1001)]
+        with aioresponses() as m:
+            m.post(
+                "http://localhost:3000/api/validate-bulk",
+                payload={
+                    "results": [],
+                    "summary": {
+                        "total": 1000,
+                        "valid": 1000,
+                        "invalid": 0,
+                        "risky": 0,
+                        "unknown": 0,
+                    },
+                    "processingTime": 100,
+                },
+            )
+            m.post(
+                "http://localhost:3000/api/validate-bulk",
+                payload={
+                    "results": [],
+                    "summary": {"total": 1, "valid": 1, "invalid": 0, "risky": 0, "unknown": 0},
+                    "processingTime": 20,
+                },
+            )
+
+            result = await async_validator.validate_bulk(emails)
+
+            assert result.summary.total == 1001
+            assert result.summary.valid == 1001
+            assert result.processing_time == 100
+
+        await async_validator.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_validate_parses_large_response_off_loop(self, async_validator, monkeypatch):
+        monkeypatch.setattr(async_client, "_OFFLOAD_PARSE_MIN_BYTES", 0)
+        with aioresponses() as m:
+            m.post(
+                "http://localhost:3000/api/validate-bulk",
+                payload={
+                    "results": [],
+                    "summary": {"total": 1, "valid": 1, "invalid": 0, "risky": 0, "unknown": 0},
+                    "processingTime": 5,
+                },
+            )
+
+            result = await async_validator.validate_bulk(["a@b.com"])
+
+            assert result.summary.total == 1
+
+        await async_validator.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_validate_chunk_size_too_large(self, async_validator):
         with pytest.raises(ValidationError):
-            await async_validator.validate_bulk(emails)
+            await async_validator.validate_bulk(["a@b.com"], chunk_size=1001)
+        await async_validator.close()
+
+    @pytest.mark.asyncio
+    async def test_bulk_validate_invalid_format(self, async_validator):
+        with pytest.raises(ValidationError) as exc_info:
+            await async_validator.validate_bulk(["a@b.com", "not-an-email"])
+        assert exc_info.value.details == ["not-an-email"]
         await async_validator.close()
 
 
@@ -153,6 +230,161 @@ class TestAsyncHealthCheck:
 
         await async_validator.close()
 
+    @pytest.mark.asyncio
+    async def test_health_check_revalidates_with_etag(self, async_validator):
+        with aioresponses() as m:
+            m.get(
+                "http://localhost:3000/api/health",
+                payload={
+                    "status": "healthy",
+                    "version": "1.0.0",
+                    "uptime": 12345,
+                    "timestamp": "2024-01-01T00:00:00Z",
+                },
+                headers={"ETag": '"v1"'},
+            )
+            m.get("http://localhost:3000/api/health", status=304)
+
+            first = await async_validator.health_check()
+            first.status = "mutated"
+            second = await async_validator.health_check()
+
+            assert second.status == "healthy"
+            assert second is not first
+            calls = m.requests[("GET", URL("http://localhost:3000/api/health"))]
+            assert calls[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+
+        await async_validator.close()
+
+
+class TestAsyncRetryLogic:
+    @pytest.mark.asyncio
+    async def test_stops_retrying_when_budget_spent(self):
+        validator = AsyncEmailValidator(
+            base_url="http://localhost:3000",
+            max_retries=5,
+            retry_delay=1.0,
+            total_timeout=0.5,
+        )
+        with aioresponses() as m:
+            m.post("http://localhost:3000/api/validate", status=500, repeat=True)
+
+            with pytest.raises(EmailValidatorError) as exc_info:
+                await validator.validate("test@example.com")
+
+            assert exc_info.value.status_code == 500
+            assert len(m.requests[("POST", URL("http://localhost:3000/api/validate"))]) == 1
+
+        await validator.close()
+
+
+class TestAsyncSession:
+    @pytest.mark.asyncio
+    async def test_session_uses_dns_cache(self, async_validator):
+        session = await async_validator._get_session()
+
+        assert isinstance(session.connector, aiohttp.TCPConnector)
+        assert session.connector.use_dns_cache is True
+
+        await async_validator.close()
+        assert session.connector is None or session.connector.closed
+
+    @pytest.mark.asyncio
+    async def test_shared_connector_outlives_instances(self):
+        shared = AsyncEmailValidator.configure_shared_connector(limit_per_host=4)
+        try:
+            first = AsyncEmailValidator(base_url="http://localhost:3000")
+            second = AsyncEmailValidator(base_url="http://localhost:3000")
+
+            assert (await first._get_session()).connector is shared
+            assert (await second._get_session()).connector is shared
+
+            await first.close()
+            await second.close()
+            assert not shared.closed
+        finally:
+            await AsyncEmailValidator.close_shared_connector()
+
+        assert shared.closed
+        assert AsyncEmailValidator._shared_connector is None
+
+    @pytest.mark.asyncio
+    async def test_shared_connector_is_not_replaced_while_open(self):
+        shared = AsyncEmailValidator.configure_shared_connector()
+        try:
+            with pytest.raises(RuntimeError):
+                AsyncEmailValidator.configure_shared_connector(limit_per_host=4)
+            assert AsyncEmailValidator._shared_connector is shared
+            assert not shared.closed
+        finally:
+            await AsyncEmailValidator.close_shared_connector()
+
+        replacement = AsyncEmailValidator.configure_shared_connector(limit_per_host=4)
+        try:
+            assert replacement is not shared
+            assert replacement.limit_per_host == 4
+        finally:
+            await AsyncEmailValidator.close_shared_connector()
+
+    def test_http2_requires_httpx(self, monkeypatch):
+        monkeypatch.setattr(async_client, "httpx", None)
+
+        with pytest.raises(ImportError):
+            AsyncEmailValidator(base_url="http://localhost:3000", http2=True)
+
+
+def _http2_validator(monkeypatch, handler):
+    """An http2=True client whose httpx traffic goes to ``handler``."""
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(handler), **kwargs)
+
+    monkeypatch.setattr(async_client.httpx, "AsyncClient", client)
+    return AsyncEmailValidator(
+        base_url="http://localhost:3000", api_key="test-key", max_retries=0, http2=True
+    )
+
+
+class TestAsyncHttp2:
+    @pytest.mark.asyncio
+    async def test_validate_over_httpx(self, monkeypatch, validation_response):
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(200, json=validation_response)
+
+        async with _http2_validator(monkeypatch, handler) as validator:
+            result = await validator.validate("test@example.com")
+            assert validator._session is None
+
+        assert result.valid is True
+        assert requests[0].url == "http://localhost:3000/api/validate"
+        assert requests[0].headers["X-API-Key"] == "test-key"
+        assert json.loads(requests[0].content) == {"email": "test@example.com"}
+        assert validator._http2_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_timeout_becomes_sdk_timeout_error(self, monkeypatch):
+        def handler(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        async with _http2_validator(monkeypatch, handler) as validator:
+            with pytest.raises(SDKTimeoutError):
+                await validator.validate("test@example.com")
+
+    @pytest.mark.asyncio
+    async def test_transport_error_becomes_network_error(self, monkeypatch):
+        def handler(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        async with _http2_validator(monkeypatch, handler) as validator:
+            with pytest.raises(NetworkError) as exc_info:
+                await validator.validate("test@example.com")
+
+        assert isinstance(exc_info.value.cause, httpx.ConnectError)
+
 
 class TestAsyncContextManager:
     @pytest.mark.asyncio
@@ -1,14 +1,22 @@
 """Tests for synchronous client."""
 
+import gzip
+import json
+
 import pytest
 import responses
 
 from email_validator_sdk import (
-    EmailValidator,
-    ValidationError,
     AuthenticationError,
+    EmailValidator,
+    EmailValidatorError,
     RateLimitError,
+    ValidationError,
+    ValidationOptions,
+    ValidationResult,
+    close_shared_session,
 )
+from email_validator_sdk.client import get_shared_session
 
 
 @pytest.fixture
@@ -22,7 +30,21 @@ def validator():
 
 class TestValidate:
     @responses.activate
-    def test_validate_success(self, validator):
+    def test_validate_success(self, validator, validation_response):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            json=validation_response,
+            status=200,
+        )
+
+        result = validator.validate("test@example.com")
+
+        assert result.valid is True
+        assert result.score == 95
+
+    @responses.activate
+    def test_validate_ignores_unmodelled_fields(self, validator):
         responses.add(
             responses.POST,
             "http://localhost:3000/api/validate",
@@ -33,12 +55,9 @@ class TestValidate:
                 "deliverability": "deliverable",
                 "risk": "low",
                 "checks": {
-                    "syntax": {"valid": True},
-                    "domain": {"valid": True, "exists": True},
-                    "mx": {"valid": True, "records": ["mx.example.com"]},
-                    "disposable": {"isDisposable": False},
-                    "roleBased": {"isRoleBased": False},
-                    "freeProvider": {"isFreeProvider": False},
+                    "syntax": {"valid": True, "message": "Valid syntax"},
+                    "domain": {"valid": True, "exists": True, "message": "Domain exists"},
+                    "mx": {"valid": True, "records": ["mx.example.com"], "message": "Found"},
                 },
             },
             status=200,
@@ -46,8 +65,10 @@ class TestValidate:
 
         result = validator.validate("test@example.com")
 
-        assert result.valid is True
-        assert result.score == 95
+        assert result.checks.syntax.valid is True
+        assert result.checks.domain.exists is True
+        assert result.checks.mx.records == ["mx.example.com"]
+        assert result.checks.disposable.is_disposable is False
 
     def test_validate_empty_email(self, validator):
         with pytest.raises(ValidationError):
@@ -61,6 +82,11 @@ class TestValidate:
         with pytest.raises(ValidationError):
             validator.validate("not-an-email")
 
+    def test_validate_skip_format_check_still_requires_string(self):
+        validator = EmailValidator(base_url="http://localhost:3000", cache_ttl=60)
+        with pytest.raises(ValidationError):
+            validator.validate(None, skip_format_check=True)
+
     @responses.activate
     def test_validate_unauthorized(self, validator):
         responses.add(
@@ -89,25 +115,11 @@ class TestValidate:
         assert exc_info.value.retry_after == 60
 
     @responses.activate
-    def test_validate_includes_api_key(self, validator):
+    def test_validate_includes_api_key(self, validator, validation_response):
         responses.add(
             responses.POST,
             "http://localhost:3000/api/validate",
-            json={
-                "email": "test@example.com",
-                "valid": True,
-                "score": 95,
-                "deliverability": "deliverable",
-                "risk": "low",
-                "checks": {
-                    "syntax": {"valid": True},
-                    "domain": {"valid": True, "exists": True},
-                    "mx": {"valid": True, "records": []},
-                    "disposable": {"isDisposable": False},
-                    "roleBased": {"isRoleBased": False},
-                    "freeProvider": {"isFreeProvider": False},
-                },
-            },
+            json=validation_response,
             status=200,
         )
 
@@ -116,31 +128,82 @@ class TestValidate:
         assert responses.calls[0].request.headers["X-API-Key"] == "test-key"
 
     @responses.activate
-    def test_validate_includes_user_agent(self, validator):
+    def test_validate_includes_user_agent(self, validator, validation_response):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            json=validation_response,
+            status=200,
+        )
+
+        validator.validate("test@example.com")
+
+        assert "EmailValidator-Python-SDK" in responses.calls[0].request.headers["User-Agent"]
+
+
+class TestValidationCache:
+    @responses.activate
+    def test_repeated_validate_served_from_cache(self, validation_response):
+        validator = EmailValidator(base_url="http://localhost:3000", max_retries=0, cache_ttl=60)
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            json=validation_response,
+            status=200,
+        )
+
+        first = validator.validate("test@example.com")
+        second = validator.validate("TEST@example.com")
+
+        assert second == first
+        assert len(responses.calls) == 1
+
+        validator.clear_cache()
+        validator.validate("test@example.com")
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_cache_hits_are_independent_copies(self, validation_response):
+        validator = EmailValidator(base_url="http://localhost:3000", max_retries=0, cache_ttl=60)
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            json=validation_response,
+            status=200,
+        )
+
+        first = validator.validate("test@example.com")
+        first.score = 0
+        first.checks.mx.records.append("evil.example.com")
+        second = validator.validate("test@example.com")
+        second.checks.mx.records.clear()
+
+        assert validator.validate("test@example.com") == ValidationResult.from_dict(
+            validation_response
+        )
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_unknown_results_not_cached(self):
+        validator = EmailValidator(base_url="http://localhost:3000", max_retries=0, cache_ttl=60)
         responses.add(
             responses.POST,
             "http://localhost:3000/api/validate",
             json={
                 "email": "test@example.com",
-                "valid": True,
-                "score": 95,
-                "deliverability": "deliverable",
-                "risk": "low",
-                "checks": {
-                    "syntax": {"valid": True},
-                    "domain": {"valid": True, "exists": True},
-                    "mx": {"valid": True, "records": []},
-                    "disposable": {"isDisposable": False},
-                    "roleBased": {"isRoleBased": False},
-                    "freeProvider": {"isFreeProvider": False},
-                },
+                "valid": False,
+                "score": 40,
+                "deliverability": "unknown",
+                "risk": "medium",
+                "checks": {},
             },
             status=200,
         )
 
+        validator.validate("test@example.com")
         validator.validate("test@example.com")
 
-        assert "EmailValidator-Python-SDK" in responses.calls[0].request.headers["User-Agent"]
+        assert len(responses.calls) == 2
 
 
 class TestValidateBulk:
@@ -167,6 +230,177 @@ class TestValidateBulk:
 
         assert result.summary.total == 2
 
+    @responses.activate
+    def test_bulk_validate_parses_results(self, validator):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [
+                    {
+                        "email": "info@gmail.com",
+                        "valid": True,
+                        "score": 70,
+                        "deliverability": "risky",
+                        "risk": "medium",
+                        "checks": {
+                            "syntax": {"valid": True},
+                            "domain": {"valid": True, "exists": True},
+                            "mx": {"valid": True, "records": ["mx.gmail.com"]},
+                            "disposable": {"isDisposable": False},
+                            "roleBased": {"isRoleBased": True, "role": "info"},
+                            "freeProvider": {"isFreeProvider": True, "provider": "Gmail"},
+                        },
+                    }
+                ],
+                "summary": {"total": 1, "valid": 0, "invalid": 0, "risky": 1, "unknown": 0},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+
+        result = validator.validate_bulk(["info@gmail.com"])
+
+        checks = result.results[0].checks
+        assert checks.role_based.role == "info"
+        assert checks.free_provider.provider == "Gmail"
+        assert checks.mx.records == ["mx.gmail.com"]
+
+    @responses.activate
+    def test_bulk_validate_dedupes_input(self, validator):
+        def result_for(email):
+            return {
+                "email": email,
+                "valid": True,
+                "score": 90,
+                "deliverability": "deliverable",
+                "risk": "low",
+                "checks": {},
+            }
+
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [result_for("a@b.com"), result_for("c@d.com")],
+                "summary": {"total": 2, "valid": 2, "invalid": 0, "risky": 0, "unknown": 0},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+
+        result = validator.validate_bulk(["a@b.com", "c@d.com", "a@b.com"])
+
+        assert json.loads(responses.calls[0].request.body) == {"emails": ["a@b.com", "c@d.com"]}
+        assert [r.email for r in result.results] == ["a@b.com", "c@d.com", "a@b.com"]
+        assert result.results[0] is result.results[2]
+        assert result.duplicates == 1
+        assert result.summary.total == 2
+
+    @pytest.mark.parametrize(
+        "emails",
+        [["a@b.com", "c@d.com"], ["a@b.com", "c@d.com", "a@b.com"]],
+        ids=["unique", "duplicates"],
+    )
+    @responses.activate
+    def test_bulk_validate_reports_missing_results(self, validator, emails):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [
+                    {
+                        "email": "a@b.com",
+                        "valid": True,
+                        "score": 90,
+                        "deliverability": "deliverable",
+                        "risk": "low",
+                        "checks": {},
+                    }
+                ],
+                "summary": {"total": 2, "valid": 1, "invalid": 0, "risky": 0, "unknown": 1},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+
+        result = validator.validate_bulk(emails)
+
+        assert [r.email for r in result.results] == [e for e in emails if e == "a@b.com"]
+        assert result.missing == ["c@d.com"]
+        assert result.duplicates == len(emails) - 2
+
+    @responses.activate
+    def test_bulk_validate_sends_json_body(self, validator):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [],
+                "summary": {"total": 1, "valid": 1, "invalid": 0, "risky": 0, "unknown": 0},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+
+        validator.validate_bulk(["a@b.com"])
+
+        request = responses.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"emails": ["a@b.com"]}
+
+    @responses.activate
+    def test_bulk_validate_sends_options(self, validator):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [],
+                "summary": {"total": 1, "valid": 1, "invalid": 0, "risky": 0, "unknown": 0},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+        options = ValidationOptions(smtp_check=True)
+
+        validator.validate_bulk(["a@b.com"], options)
+        options.smtp_check = False
+        validator.validate_bulk(["a@b.com"], options)
+
+        assert json.loads(responses.calls[0].request.body) == {
+            "emails": ["a@b.com"],
+            "smtpCheck": True,
+            "authCheck": False,
+            "reputationCheck": False,
+            "gravatarCheck": False,
+        }
+        assert json.loads(responses.calls[1].request.body)["smtpCheck"] is False
+
+    @responses.activate
+    def test_bulk_validate_gzips_large_bodies_when_enabled(self):
+        validator = EmailValidator(
+            base_url="http://localhost:3000", max_retries=0, compress_requests=True
+        )
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [],
+                "summary": {"total": 0, "valid": 0, "invalid": 0, "risky": 0, "unknown": 0},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+        emails = [f"user{i}@example.com" for i in range(100)]
+
+        validator.validate_bulk(emails)
+        validator.validate_bulk(emails[:10])
+
+        large, small = (call.request for call in responses.calls)
+        assert large.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(large.body)) == {"emails": emails}
+        assert "Content-Encoding" not in small.headers
+
     def test_bulk_validate_empty_list(self, validator):
         with pytest.raises(ValidationError):
             validator.validate_bulk([])
@@ -181,6 +415,30 @@ class TestValidateBulk:
             validator.validate_bulk(emails)
         assert "Maximum 1000" in str(exc_info.value)
 
+    @responses.activate
+    def test_bulk_validate_invalid_format(self, validator):
+        with pytest.raises(ValidationError) as exc_info:
+            validator.validate_bulk(["a@b.com", "not-an-email"])
+        assert exc_info.value.details == ["not-an-email"]
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_bulk_validate_skip_format_check(self, validator):
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate-bulk",
+            json={
+                "results": [],
+                "summary": {"total": 1, "valid": 0, "invalid": 1, "risky": 0, "unknown": 0},
+                "processingTime": 10,
+            },
+            status=200,
+        )
+
+        validator.validate_bulk(["not-an-email"], skip_format_check=True)
+
+        assert json.loads(responses.calls[0].request.body) == {"emails": ["not-an-email"]}
+
 
 class TestHealthCheck:
     @responses.activate
@@ -202,10 +460,35 @@ class TestHealthCheck:
         assert result.status == "healthy"
         assert result.version == "1.0.0"
 
+    @responses.activate
+    def test_health_check_revalidates_with_etag(self, validator):
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/health",
+            json={
+                "status": "healthy",
+                "version": "1.0.0",
+                "uptime": 12345,
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+            headers={"ETag": '"v1"'},
+            status=200,
+        )
+        responses.add(responses.GET, "http://localhost:3000/api/health", status=304)
+
+        first = validator.health_check()
+        first.status = "mutated"
+        second = validator.health_check()
+
+        assert second.status == "healthy"
+        assert second is not first
+        assert "If-None-Match" not in responses.calls[0].request.headers
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+
 
 class TestRetryLogic:
     @responses.activate
-    def test_retries_on_500(self):
+    def test_retries_on_500(self, validation_response):
         validator_with_retry = EmailValidator(
             base_url="http://localhost:3000",
             max_retries=2,
@@ -217,21 +500,7 @@ class TestRetryLogic:
         responses.add(
             responses.POST,
             "http://localhost:3000/api/validate",
-            json={
-                "email": "test@example.com",
-                "valid": True,
-                "score": 95,
-                "deliverability": "deliverable",
-                "risk": "low",
-                "checks": {
-                    "syntax": {"valid": True},
-                    "domain": {"valid": True, "exists": True},
-                    "mx": {"valid": True, "records": []},
-                    "disposable": {"isDisposable": False},
-                    "roleBased": {"isRoleBased": False},
-                    "freeProvider": {"isFreeProvider": False},
-                },
-            },
+            json=validation_response,
             status=200,
         )
 
@@ -240,6 +509,129 @@ class TestRetryLogic:
         assert result.valid is True
         assert len(responses.calls) == 3
 
+    @responses.activate
+    def test_retries_rate_limit_after_retry_after(self, validation_response):
+        validator_with_retry = EmailValidator(
+            base_url="http://localhost:3000",
+            max_retries=1,
+            retry_delay=0.01,
+        )
+
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            status=429,
+            headers={"Retry-After": "0"},
+        )
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            json=validation_response,
+            status=200,
+        )
+
+        result = validator_with_retry.validate("test@example.com")
+
+        assert result.valid is True
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_does_not_wait_past_backoff_cap(self):
+        validator_with_retry = EmailValidator(
+            base_url="http://localhost:3000",
+            max_retries=3,
+            retry_delay=0.01,
+        )
+
+        responses.add(
+            responses.POST,
+            "http://localhost:3000/api/validate",
+            status=429,
+            headers={"Retry-After": "3600"},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            validator_with_retry.validate("test@example.com")
+
+        assert exc_info.value.retry_after == 3600
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_stops_retrying_when_budget_spent(self):
+        validator_with_retry = EmailValidator(
+            base_url="http://localhost:3000",
+            max_retries=5,
+            retry_delay=1.0,
+            total_timeout=0.5,
+        )
+
+        responses.add(responses.POST, "http://localhost:3000/api/validate", status=500)
+
+        with pytest.raises(EmailValidatorError) as exc_info:
+            validator_with_retry.validate("test@example.com")
+
+        assert exc_info.value.status_code == 500
+        assert len(responses.calls) == 1
+
+    def test_default_total_timeout(self):
+        validator_with_retry = EmailValidator(
+            base_url="http://localhost:3000", timeout=10.0, max_retries=2
+        )
+        assert validator_with_retry.total_timeout == 30.0
+
+
+class TestSession:
+    def test_environment_resolved_once(self, monkeypatch):
+        monkeypatch.delenv("http_proxy", raising=False)
+        monkeypatch.setenv("HTTP_PROXY", "http://proxy.local:8080")
+        monkeypatch.delenv("NO_PROXY", raising=False)
+        monkeypatch.delenv("no_proxy", raising=False)
+
+        validator = EmailValidator(base_url="http://api.example.com")
+
+        assert validator._session.trust_env is False
+        assert validator._session.proxies["http"] == "http://proxy.local:8080"
+
+    @responses.activate
+    def test_shared_session_keeps_per_client_headers(self):
+        first = EmailValidator(base_url="http://localhost:3000", api_key="one", shared_session=True)
+        second = EmailValidator(
+            base_url="http://localhost:3000", api_key="two", shared_session=True
+        )
+        responses.add(
+            responses.GET,
+            "http://localhost:3000/api/health",
+            json={
+                "status": "healthy",
+                "version": "1.0.0",
+                "uptime": 1,
+                "timestamp": "2024-01-01T00:00:00Z",
+            },
+            status=200,
+        )
+
+        first.health_check()
+        second.health_check()
+        first.close()
+
+        assert first._session is second._session is get_shared_session()
+        assert responses.calls[0].request.headers["X-API-Key"] == "one"
+        assert responses.calls[1].request.headers["X-API-Key"] == "two"
+        assert get_shared_session().get_adapter("https://api.example.com")._pool_maxsize == 64
+
+    def test_close_shared_session(self):
+        session = get_shared_session()
+        adapter = session.get_adapter("https://api.example.com")
+        adapter.poolmanager.connection_from_url("https://api.example.com")
+        assert len(adapter.poolmanager.pools) == 1
+
+        close_shared_session()
+
+        assert len(adapter.poolmanager.pools) == 0
+        assert get_shared_session() is not session
+        close_shared_session()
+        close_shared_session()
+
 
 class TestContextManager:
     def test_context_manager(self):
@@ -0,0 +1,108 @@
+"""Tests for utility functions."""
+
+import pytest
+
+from email_validator_sdk import utils
+from email_validator_sdk.utils import (
+    TTLCache,
+    get_backoff_delay,
+    is_valid_email_format,
+    is_valid_email_format_fast,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+)
+
+
+@pytest.mark.parametrize(
+    "email",
+    [
+        "test@example.com",
+        "a@b.co",
+        "a@.b.c",
+        "first.last@sub.example.org",
+        "user@b.c.",
+        "",
+        "@example.com",
+        "test@",
+        "test@example",
+        "test@example.",
+        "test@.com",
+        "a@b@c.com",
+        "te st@example.com",
+        "test@example.com\n",
+        "test@exa\x1cmple.com",
+        "tést@example.com",
+        "test@exa mple.com",
+    ],
+)
+def test_fast_format_check_matches_regex(email):
+    assert is_valid_email_format_fast(email) == is_valid_email_format(email)
+
+
+def test_format_check_rejects_trailing_newline():
+    assert is_valid_email_format("test@example.com\n") is False
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(utils, "orjson", None)
+    payload = {"emails": ["a@b.com"], "smtpCheck": False}
+
+    body = json_dumps(payload)
+
+    assert isinstance(body, bytes)
+    assert json_loads(body) == payload
+
+
+def test_backoff_delay_is_decorrelated_and_capped():
+    prev = None
+    for attempt in range(20):
+        delay = get_backoff_delay(attempt, 0.5, prev, cap=4.0)
+        assert 0.5 <= delay <= min(4.0, (prev or 0.5) * 3)
+        prev = delay
+
+
+def test_backoff_delay_honors_retry_after():
+    assert get_backoff_delay(0, 1.0, retry_after=7.0) == 7.0
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("60", 60.0),
+        ("0", 0.0),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+        ("soon", None),
+        (None, None),
+    ],
+)
+def test_parse_retry_after(value, expected):
+    assert parse_retry_after(value) == expected
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(utils.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=5)
+    cache.set("a", 1)
+
+    now[0] += 4
+    assert cache.get("a") == 1
+    now[0] += 2
+    assert cache.get("a") is None
+    assert len(cache) == 0
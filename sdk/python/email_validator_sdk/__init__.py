@@ -4,17 +4,33 @@ Official SDK for the Email Validator API
 """
 
 from .client import EmailValidator
-from .async_client import AsyncEmailValidator
+from .async_client import AsyncEmailValidator, close_default_connector
+from .httpx_client import HttpxAsyncEmailValidator
+from .exceptions import (
+    EmailValidatorError,
+    ValidationError,
+    APIError,
+    AuthenticationError,
+    RateLimitError,
+)
 from .types import (
     ValidationResult,
     BulkValidationResult,
     ValidateOptions,
 )
+from .utils import VERSION
 
-__version__ = "1.0.0"
+__version__ = VERSION
 __all__ = [
     "EmailValidator",
     "AsyncEmailValidator",
+    "close_default_connector",
+    "HttpxAsyncEmailValidator",
+    "EmailValidatorError",
+    "ValidationError",
+    "APIError",
+    "AuthenticationError",
+    "RateLimitError",
     "ValidationResult",
     "BulkValidationResult",
     "ValidateOptions",
@@ -2,10 +2,82 @@
 Asynchronous Email Validator client
 """
 
+import asyncio
+import time
 import aiohttp
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Mapping, Tuple
 
-from .types import ValidationResult, BulkValidationResult, ValidateOptions
+from .exceptions import APIError, AuthenticationError, RateLimitError, ValidationError
+from .types import ValidationResult, BulkValidationResult, ValidateOptions, _validate_body
+from .utils import (
+    MAX_BULK_SIZE,
+    RETRY_AFTER_STATUSES,
+    RETRYABLE_STATUSES,
+    TTLCache,
+    backoff_delay,
+    build_headers,
+    is_valid_email,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+    prepare_bulk_emails,
+)
+
+# Response read buffer; large enough for a full 1000-email bulk response
+_READ_BUFSIZE = 1 << 20
+
+_default_connector: Optional[aiohttp.TCPConnector] = None
+_default_connector_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_default_connector() -> aiohttp.TCPConnector:
+    """
+    Return the module-wide connection pool shared by clients without a connector.
+
+    The connector is created lazily on first use, keeps connections alive and
+    caches DNS lookups, so clients created around individual calls still reuse
+    warm connections. Must be called from a running event loop; a new pool is
+    built when called from a different loop than the current one belongs to,
+    and the previous pool is closed. Release it with
+    :func:`close_default_connector`.
+    """
+    global _default_connector, _default_connector_loop
+    loop = asyncio.get_running_loop()
+    if (
+        _default_connector is None
+        or _default_connector.closed
+        or _default_connector_loop is not loop
+    ):
+        if _default_connector is not None and not _default_connector.closed:
+            # Pools are bound to their loop, so the old one cannot be reused
+            asyncio.ensure_future(_default_connector.close())
+        _default_connector_loop = loop
+        _default_connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+            keepalive_timeout=75,
+        )
+    return _default_connector
+
+
+async def close_default_connector() -> None:
+    """Close the module-wide connection pool returned by get_default_connector."""
+    global _default_connector, _default_connector_loop
+    connector = _default_connector
+    _default_connector = None
+    _default_connector_loop = None
+    if connector is not None and not connector.closed:
+        await connector.close()
+
+
+def _error_message(status: int, content: bytes) -> str:
+    """Extract the error message from an API error response body."""
+    try:
+        return json_loads(content).get("error", f"HTTP {status}")
+    except Exception:
+        return f"HTTP {status}"
 
 
 class AsyncEmailValidator:
@@ -16,13 +88,28 @@ class AsyncEmailValidator:
         async with AsyncEmailValidator(api_key='your-api-key') as validator:
             result = await validator.validate('test@example.com')
             print(result.is_valid, result.score)
+
+    For bulk and highly concurrent workloads, call
+    ``email_validator_sdk.runtime.install_fast_loop()`` before
+    ``asyncio.run()`` to run on uvloop when it is installed.
     """
 
+    # Transport errors that are retried like 5xx responses
+    _RETRY_EXCEPTIONS: Tuple[type, ...] = (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: str = "http://localhost:3000",
         timeout: int = 30,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: float = 0.5,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        health_cache_ttl: float = 5.0,
     ):
         """
         Initialize the async Email Validator client.
@@ -31,26 +118,74 @@ class AsyncEmailValidator:
             api_key: API key for authentication (optional)
             base_url: Base URL of the API
             timeout: Request timeout in seconds
+            connector: Connection pool to use instead of the module default;
+                pass your own to control its limits or lifetime (for example
+                when reloading). It is never closed by the client.
+            max_retries: Retries for connection errors, timeouts, 429 and 5xx responses
+            retry_base_delay: Delay before the first retry in seconds; doubles per retry
+            retry_max_delay: Upper bound for the exponential delay in seconds
+            retry_jitter: Extra random fraction of the delay added to each wait
+            cache_size: Maximum number of cached ``validate()`` results
+            cache_ttl: Seconds to reuse a ``validate()`` result for the same
+                email and options; caching is disabled when None
+            health_cache_ttl: Seconds to reuse a ``health()`` response for;
+                0 disables it
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
+        self._cache = TTLCache(cache_size, cache_ttl) if cache_ttl else None
+        self.health_cache_ttl = health_cache_ttl
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._connector = connector
         self._session: Optional[aiohttp.ClientSession] = None
+        self._refcount = 0
+        # Created on first use so it binds to the running event loop
+        self._lifecycle_lock: Optional[asyncio.Lock] = None
+        self._health_lock: Optional[asyncio.Lock] = None
 
-    async def __aenter__(self):
-        headers = {"Content-Type": "application/json"}
-        if self.api_key:
-            headers["Authorization"] = f"Bearer {self.api_key}"
+    def _headers(self) -> Dict[str, str]:
+        """Headers sent with every request."""
+        return build_headers(self.api_key)
 
-        self._session = aiohttp.ClientSession(
-            headers=headers,
-            timeout=self.timeout,
-        )
+    async def __aenter__(self):
+        # Nested or concurrent ``async with`` blocks share one session, which
+        # is only closed when the outermost block exits
+        if self._lifecycle_lock is None:
+            self._lifecycle_lock = asyncio.Lock()
+        async with self._lifecycle_lock:
+            if self._refcount == 0:
+                await self._open()
+            self._refcount += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        async with self._lifecycle_lock:
+            self._refcount -= 1
+            if self._refcount == 0:
+                await self._close()
+
+    async def _open(self) -> None:
+        """Create the HTTP session."""
+        if self._session is None or self._session.closed:
+            # The pool outlives the session so keep-alive connections carry over
+            self._session = aiohttp.ClientSession(
+                headers=self._headers(),
+                timeout=self.timeout,
+                connector=self._connector or get_default_connector(),
+                connector_owner=False,
+                read_bufsize=_READ_BUFSIZE,
+            )
+
+    async def _close(self) -> None:
+        """Close the HTTP session."""
         if self._session:
             await self._session.close()
+            self._session = None
 
     async def validate(
         self,
@@ -66,38 +201,128 @@ class AsyncEmailValidator:
 
         Returns:
             ValidationResult with validation details
+
+        Raises:
+            ValidationError: If the email is missing or malformed
         """
-        options = options or ValidateOptions()
+        if not email or not isinstance(email, str) or not is_valid_email(email):
+            raise ValidationError("A valid email address is required")
 
-        payload: Dict[str, Any] = {
-            "email": email,
-        }
+        # Webhook requests trigger a callback, so they always go to the API
+        cache = self._cache if options is None or not options.webhook_url else None
+        if cache is not None:
+            cache_key = (email.lower(), options)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                # The raw body is cached so every hit gets its own result
+                return ValidationResult.from_dict(json_loads(cached))
 
-        if options.smtp_check:
-            payload["smtpCheck"] = True
-        if options.auth_check:
-            payload["authCheck"] = True
-        if options.reputation_check:
-            payload["reputationCheck"] = True
-        if options.gravatar_check:
-            payload["gravatarCheck"] = True
+        body = _validate_body(email, options)
+        content = await self._request_content("POST", "/api/validate", data=body)
+        if cache is not None:
+            cache.set(cache_key, content)
+        return ValidationResult.from_dict(json_loads(content))
 
-        response = await self._request("POST", "/api/validate", json=payload)
-        return ValidationResult.from_dict(response)
+    def cache_clear(self) -> None:
+        """Drop all cached ``validate()`` results."""
+        if self._cache is not None:
+            self._cache.clear()
 
-    async def validate_bulk(self, emails: List[str]) -> BulkValidationResult:
+    async def validate_bulk(
+        self,
+        emails: List[str],
+        skip_client_dedup: bool = False,
+    ) -> BulkValidationResult:
         """
         Validate multiple email addresses.
 
+        Addresses are trimmed, lower-cased, deduplicated and format-checked
+        before sending, so only addresses the API would process go over the
+        wire. What was dropped is added to ``metadata.duplicates_removed``
+        and ``metadata.invalid_removed``.
+
         Args:
             emails: List of email addresses to validate
+            skip_client_dedup: Send ``emails`` exactly as given
 
         Returns:
             BulkValidationResult with all validation results
+
+        Raises:
+            ValidationError: If the list is empty or has more than 1000 emails
         """
+        if not emails:
+            raise ValidationError("Emails list cannot be empty")
+        if len(emails) > MAX_BULK_SIZE:
+            raise ValidationError(f"Maximum {MAX_BULK_SIZE} emails per request")
+
+        duplicates = invalid = 0
+        if not skip_client_dedup:
+            emails, duplicates, invalid = prepare_bulk_emails(emails)
+            if not emails:
+                # Nothing left to validate; don't spend a round trip on it
+                return BulkValidationResult.from_dict(
+                    {"metadata": {"duplicatesRemoved": duplicates, "invalidRemoved": invalid}}
+                )
+
         payload = {"emails": emails}
         response = await self._request("POST", "/api/validate-bulk", json=payload)
-        return BulkValidationResult.from_dict(response)
+        result = BulkValidationResult.from_dict(response)
+        result.metadata.duplicates_removed += duplicates
+        result.metadata.invalid_removed += invalid
+        return result
+
+    async def validate_bulk_parallel(
+        self,
+        emails: List[str],
+        chunk_size: int = 100,
+        concurrency: int = 10,
+        skip_client_dedup: bool = False,
+    ) -> BulkValidationResult:
+        """
+        Validate multiple email addresses as concurrent chunked requests.
+
+        The list is split into chunks of ``chunk_size`` that are sent as
+        separate bulk requests, at most ``concurrency`` at a time, and the
+        results are merged in input order. Smaller requests overlap network
+        and server time and are retried independently.
+
+        Args:
+            emails: List of email addresses to validate
+            chunk_size: Maximum emails per request
+            concurrency: Maximum requests in flight at once
+            skip_client_dedup: Send ``emails`` exactly as given; otherwise they
+                are cleaned once up front as in :meth:`validate_bulk`
+
+        Returns:
+            BulkValidationResult with all validation results
+
+        Raises:
+            ValidationError: If the list is empty or the limits are out of range
+        """
+        if not emails:
+            raise ValidationError("Emails list cannot be empty")
+        if not 1 <= chunk_size <= MAX_BULK_SIZE:
+            raise ValidationError(f"chunk_size must be between 1 and {MAX_BULK_SIZE}")
+        if concurrency < 1:
+            raise ValidationError("concurrency must be at least 1")
+
+        # Clean the whole list up front so duplicates across chunks are caught
+        duplicates = invalid = 0
+        if not skip_client_dedup:
+            emails, duplicates, invalid = prepare_bulk_emails(emails)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def one(chunk: List[str]) -> BulkValidationResult:
+            async with semaphore:
+                return await self.validate_bulk(chunk, skip_client_dedup=True)
+
+        chunks = [emails[i : i + chunk_size] for i in range(0, len(emails), chunk_size)]
+        result = BulkValidationResult.merge(await asyncio.gather(*(one(c) for c in chunks)))
+        result.metadata.duplicates_removed += duplicates
+        result.metadata.invalid_removed += invalid
+        return result
 
     async def health(self) -> Dict[str, Any]:
         """
@@ -106,7 +331,22 @@ class AsyncEmailValidator:
         Returns:
             Health status information
         """
-        return await self._request("GET", "/api/health")
+        cached = self._health_cache
+        if cached is not None and time.monotonic() - cached[0] < self.health_cache_ttl:
+            return dict(cached[1])
+
+        # Concurrent pollers wait for one request instead of each sending their own
+        if self._health_lock is None:
+            self._health_lock = asyncio.Lock()
+        async with self._health_lock:
+            now = time.monotonic()
+            cached = self._health_cache
+            if cached is not None and now - cached[0] < self.health_cache_ttl:
+                return dict(cached[1])
+
+            result = await self._request("GET", "/api/health")
+            self._health_cache = (now, result)
+            return dict(result)
 
     async def _request(
         self,
@@ -114,19 +354,70 @@ class AsyncEmailValidator:
         endpoint: str,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Make async HTTP request to API."""
-        if not self._session:
-            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+        """Make async HTTP request to API and decode the JSON response."""
+        return json_loads(await self._request_content(method, endpoint, **kwargs))
 
+    async def _request_content(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs,
+    ) -> bytes:
+        """
+        Make async HTTP request to API, retrying transient failures.
+
+        Returns the raw body of the successful response. Retries follow the
+        same rules as ``EmailValidator._request_response``.
+        """
         url = f"{self.base_url}{endpoint}"
+        # Encode JSON bodies ourselves; the session already sends the Content-Type
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps(kwargs.pop("json"))
+
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
+            retry_after = None
+            try:
+                status, headers, content = await self._send(method, url, **kwargs)
+            except self._RETRY_EXCEPTIONS:
+                if not retries_left:
+                    raise
+            else:
+                if 200 <= status < 300:
+                    return content
+
+                if status == 401:
+                    raise AuthenticationError(_error_message(status, content))
+
+                if status in RETRY_AFTER_STATUSES:
+                    retry_after = parse_retry_after(headers.get("Retry-After"))
+
+                if not (
+                    status in RETRYABLE_STATUSES
+                    and retries_left
+                    and (retry_after is None or retry_after <= self.retry_max_delay)
+                ):
+                    if status == 429:
+                        raise RateLimitError(retry_after=retry_after)
+                    raise APIError(status, _error_message(status, content))
+
+            await asyncio.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send one request and return its status, headers and raw body."""
+        if not self._session:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
 
         async with self._session.request(method, url, **kwargs) as response:
-            if not response.ok:
-                try:
-                    error = await response.json()
-                    message = error.get("error", f"HTTP {response.status}")
-                except Exception:
-                    message = f"HTTP {response.status}"
-                raise Exception(f"API Error: {message}")
-
-            return await response.json()
+            return response.status, response.headers, await response.read()
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before retrying after the given attempt."""
+        return backoff_delay(
+            attempt, self.retry_base_delay, self.retry_max_delay, self.retry_jitter
+        )
@@ -2,10 +2,73 @@
 Synchronous Email Validator client
 """
 
+import os
+import time
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, List, Dict, Any, BinaryIO, Tuple
 
-from .types import ValidationResult, BulkValidationResult, ValidateOptions
+try:
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
+
+from .exceptions import APIError, AuthenticationError, RateLimitError, ValidationError
+from .types import ValidationResult, BulkValidationResult, ValidateOptions, _validate_body
+from .utils import (
+    MAX_BULK_SIZE,
+    RETRY_AFTER_STATUSES,
+    RETRYABLE_STATUSES,
+    TTLCache,
+    backoff_delay,
+    build_headers,
+    is_valid_email,
+    json_dumps,
+    json_loads,
+    parse_retry_after,
+    prepare_bulk_emails,
+)
+
+
+# Bulk requests with at least this many emails stream-parse their response
+STREAM_MIN_EMAILS = 50
+
+
+def _stream_bulk(raw: BinaryIO) -> BulkValidationResult:
+    """
+    Parse a bulk response body incrementally with ijson.
+
+    Only one result object is materialized at a time and turned into a
+    ValidationResult right away, instead of decoding the whole body first.
+    """
+    from_dict = ValidationResult.from_dict
+    results: List[ValidationResult] = []
+    metadata: Dict[str, Any] = {}
+    builder = None
+
+    for prefix, event, value in ijson.parse(raw, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "results.item" and event == "end_map":
+                results.append(from_dict(builder.value))
+                builder = None
+        elif prefix == "results.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix.startswith("metadata.") and event not in ("map_key", "start_map", "end_map"):
+            metadata[prefix[len("metadata."):]] = value
+
+    result = BulkValidationResult.from_dict({"metadata": metadata})
+    result.results = results
+    return result
+
+
+def _error_message(response: requests.Response) -> str:
+    """Extract the error message from an API error response."""
+    try:
+        return json_loads(response.content).get("error", f"HTTP {response.status_code}")
+    except Exception:
+        return f"HTTP {response.status_code}"
 
 
 class EmailValidator:
@@ -31,6 +94,14 @@ class EmailValidator:
         api_key: Optional[str] = None,
         base_url: str = "http://localhost:3000",
         timeout: int = 30,
+        pool_size: int = 20,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: float = 0.5,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        health_cache_ttl: float = 5.0,
     ):
         """
         Initialize the Email Validator client.
@@ -39,16 +110,51 @@ class EmailValidator:
             api_key: API key for authentication (optional)
             base_url: Base URL of the API
             timeout: Request timeout in seconds
+            pool_size: Maximum number of pooled keep-alive connections
+            max_retries: Retries for connection errors, timeouts, 429 and 5xx responses
+            retry_base_delay: Delay before the first retry in seconds; doubles per retry
+            retry_max_delay: Upper bound for the exponential delay in seconds
+            retry_jitter: Extra random fraction of the delay added to each wait
+            cache_size: Maximum number of cached ``validate()`` results
+            cache_ttl: Seconds to reuse a ``validate()`` result for the same
+                email and options; caching is disabled when None
+            health_cache_ttl: Seconds to reuse a ``health()`` response for;
+                0 disables it
         """
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
+        self.max_retries = max_retries
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retry_jitter = retry_jitter
+        self._cache = TTLCache(cache_size, cache_ttl) if cache_ttl else None
+        self.health_cache_ttl = health_cache_ttl
+        self._health_cache: Optional[Tuple[float, Dict[str, Any]]] = None
         self.session = requests.Session()
 
-        if api_key:
-            self.session.headers["Authorization"] = f"Bearer {api_key}"
+        # Keep enough connections alive for concurrent callers; block rather
+        # than open throwaway connections when the pool is exhausted
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=True,
+            max_retries=0,
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # The client only talks to base_url, so resolve proxy, CA bundle and
+        # netrc settings from the environment once instead of letting requests
+        # re-read them (including ~/.netrc) on every call
+        self.session.trust_env = False
+        self.session.proxies.update(requests.utils.get_environ_proxies(self.base_url))
+        self.session.verify = (
+            os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get("CURL_CA_BUNDLE") or True
+        )
+        self.session.auth = requests.utils.get_netrc_auth(self.base_url)
 
-        self.session.headers["Content-Type"] = "application/json"
+        self.session.headers.update(build_headers(api_key))
 
     def validate(
         self,
@@ -64,38 +170,84 @@ class EmailValidator:
 
         Returns:
             ValidationResult with validation details
+
+        Raises:
+            ValidationError: If the email is missing or malformed
         """
-        options = options or ValidateOptions()
+        if not email or not isinstance(email, str) or not is_valid_email(email):
+            raise ValidationError("A valid email address is required")
 
-        payload: Dict[str, Any] = {
-            "email": email,
-        }
+        # Webhook requests trigger a callback, so they always go to the API
+        cache = self._cache if options is None or not options.webhook_url else None
+        if cache is not None:
+            cache_key = (email.lower(), options)
+            cached = cache.get(cache_key)
+            if cached is not None:
+                # The raw body is cached so every hit gets its own result
+                return ValidationResult.from_dict(json_loads(cached))
 
-        if options.smtp_check:
-            payload["smtpCheck"] = True
-        if options.auth_check:
-            payload["authCheck"] = True
-        if options.reputation_check:
-            payload["reputationCheck"] = True
-        if options.gravatar_check:
-            payload["gravatarCheck"] = True
+        body = _validate_body(email, options)
+        content = self._request_response("POST", "/api/validate", data=body).content
+        if cache is not None:
+            cache.set(cache_key, content)
+        return ValidationResult.from_dict(json_loads(content))
 
-        response = self._request("POST", "/api/validate", json=payload)
-        return ValidationResult.from_dict(response)
+    def cache_clear(self) -> None:
+        """Drop all cached ``validate()`` results."""
+        if self._cache is not None:
+            self._cache.clear()
 
-    def validate_bulk(self, emails: List[str]) -> BulkValidationResult:
+    def validate_bulk(
+        self,
+        emails: List[str],
+        skip_client_dedup: bool = False,
+    ) -> BulkValidationResult:
         """
         Validate multiple email addresses.
 
+        Addresses are trimmed, lower-cased, deduplicated and format-checked
+        before sending, so only addresses the API would process go over the
+        wire. What was dropped is added to ``metadata.duplicates_removed``
+        and ``metadata.invalid_removed``.
+
         Args:
             emails: List of email addresses to validate
+            skip_client_dedup: Send ``emails`` exactly as given
 
         Returns:
             BulkValidationResult with all validation results
+
+        Raises:
+            ValidationError: If the list is empty or has more than 1000 emails
         """
+        if not emails:
+            raise ValidationError("Emails list cannot be empty")
+        if len(emails) > MAX_BULK_SIZE:
+            raise ValidationError(f"Maximum {MAX_BULK_SIZE} emails per request")
+
+        duplicates = invalid = 0
+        if not skip_client_dedup:
+            emails, duplicates, invalid = prepare_bulk_emails(emails)
+            if not emails:
+                # Nothing left to validate; don't spend a round trip on it
+                return BulkValidationResult.from_dict(
+                    {"metadata": {"duplicatesRemoved": duplicates, "invalidRemoved": invalid}}
+                )
+
         payload = {"emails": emails}
-        response = self._request("POST", "/api/validate-bulk", json=payload)
-        return BulkValidationResult.from_dict(response)
+        if ijson is not None and len(emails) >= STREAM_MIN_EMAILS:
+            response = self._request_response(
+                "POST", "/api/validate-bulk", json=payload, stream=True
+            )
+            with response:
+                response.raw.decode_content = True
+                result = _stream_bulk(response.raw)
+        else:
+            data = self._request("POST", "/api/validate-bulk", json=payload)
+            result = BulkValidationResult.from_dict(data)
+        result.metadata.duplicates_removed += duplicates
+        result.metadata.invalid_removed += invalid
+        return result
 
     def health(self) -> Dict[str, Any]:
         """
@@ -104,7 +256,14 @@ class EmailValidator:
         Returns:
             Health status information
         """
-        return self._request("GET", "/api/health")
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[0] < self.health_cache_ttl:
+            return dict(cached[1])
+
+        result = self._request("GET", "/api/health")
+        self._health_cache = (now, result)
+        return dict(result)
 
     def _request(
         self,
@@ -112,25 +271,76 @@ class EmailValidator:
         endpoint: str,
         **kwargs,
     ) -> Dict[str, Any]:
-        """Make HTTP request to API."""
-        url = f"{self.base_url}{endpoint}"
+        """Make HTTP request to API and decode the JSON response."""
+        return json_loads(self._request_response(method, endpoint, **kwargs).content)
 
-        response = self.session.request(
-            method,
-            url,
-            timeout=self.timeout,
-            **kwargs,
-        )
+    def _request_response(
+        self,
+        method: str,
+        endpoint: str,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Make HTTP request to API, retrying transient failures.
+
+        Returns the successful response; pass ``stream=True`` to read the
+        body incrementally. A ``json`` keyword argument is serialized with orjson when it is
+        installed and sent as the request body.
 
-        if not response.ok:
+        Connection errors, timeouts, 429 and 5xx responses are retried with
+        exponential backoff. A Retry-After header on 429/503 replaces the
+        computed delay; if it asks for longer than ``retry_max_delay`` the
+        error is raised instead of waiting.
+        """
+        url = f"{self.base_url}{endpoint}"
+        # Encode JSON bodies ourselves; the session already sends the Content-Type
+        if "json" in kwargs:
+            kwargs["data"] = json_dumps(kwargs.pop("json"))
+
+        for attempt in range(self.max_retries + 1):
+            retries_left = attempt < self.max_retries
             try:
-                error = response.json()
-                message = error.get("error", f"HTTP {response.status_code}")
-            except Exception:
-                message = f"HTTP {response.status_code}"
-            raise Exception(f"API Error: {message}")
+                response = self.session.request(
+                    method,
+                    url,
+                    timeout=self.timeout,
+                    **kwargs,
+                )
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if not retries_left:
+                    raise
+                time.sleep(self._backoff(attempt))
+                continue
+
+            if response.ok:
+                return response
+
+            status = response.status_code
+            if status == 401:
+                raise AuthenticationError(_error_message(response))
 
-        return response.json()
+            retry_after = None
+            if status in RETRY_AFTER_STATUSES:
+                retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+            if (
+                status in RETRYABLE_STATUSES
+                and retries_left
+                and (retry_after is None or retry_after <= self.retry_max_delay)
+            ):
+                response.close()
+                time.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+                continue
+
+            if status == 429:
+                raise RateLimitError(retry_after=retry_after)
+            raise APIError(status, _error_message(response))
+
+    def _backoff(self, attempt: int) -> float:
+        """Delay before retrying after the given attempt."""
+        return backoff_delay(
+            attempt, self.retry_base_delay, self.retry_max_delay, self.retry_jitter
+        )
 
     def __enter__(self):
         return self
@@ -0,0 +1,37 @@
+"""
+Exceptions raised by the Email Validator SDK
+"""
+
+from typing import Optional
+
+
+class EmailValidatorError(Exception):
+    """Base class for all SDK errors"""
+
+
+class ValidationError(EmailValidatorError, ValueError):
+    """The input was rejected before sending it to the API"""
+
+
+class APIError(EmailValidatorError):
+    """The API answered with an error status"""
+
+    def __init__(self, status_code: int, message: str):
+        super().__init__(f"API Error: {message}")
+        self.status_code = status_code
+        self.message = message
+
+
+class AuthenticationError(APIError):
+    """The API key is missing or invalid"""
+
+    def __init__(self, message: str = "Invalid or missing API key"):
+        super().__init__(401, message)
+
+
+class RateLimitError(APIError):
+    """The rate limit was exceeded and retries did not get through"""
+
+    def __init__(self, retry_after: Optional[float] = None, message: str = "Rate limit exceeded"):
+        super().__init__(429, message)
+        self.retry_after = retry_after
@@ -0,0 +1,120 @@
+"""
+Asynchronous Email Validator client over HTTP/2 (httpx backend)
+"""
+
+from typing import Optional, Mapping, Tuple
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+from .async_client import AsyncEmailValidator
+
+
+class HttpxAsyncEmailValidator(AsyncEmailValidator):
+    """
+    Asynchronous client that talks HTTP/2 through httpx.
+
+    A single HTTP/2 connection multiplexes many concurrent requests, so
+    concurrent ``validate()`` calls do not queue for free HTTP/1.1
+    connections. Requires the ``http2`` extra:
+
+        pip install email-validator-sdk[http2]
+
+    Usage:
+        async with HttpxAsyncEmailValidator(api_key='your-api-key') as validator:
+            result = await validator.validate('test@example.com')
+    """
+
+    # Connection failures and timeouts are both TransportErrors in httpx
+    _RETRY_EXCEPTIONS = (httpx.TransportError,) if httpx is not None else ()
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = "http://localhost:3000",
+        timeout: int = 30,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        max_retries: int = 3,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 30.0,
+        retry_jitter: float = 0.5,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = None,
+        health_cache_ttl: float = 5.0,
+    ):
+        """
+        Initialize the HTTP/2 Email Validator client.
+
+        Args:
+            api_key: API key for authentication (optional)
+            base_url: Base URL of the API
+            timeout: Request timeout in seconds
+            max_connections: Maximum number of open connections
+            max_keepalive_connections: Maximum number of idle connections kept open
+            max_retries: Retries for connection errors, timeouts, 429 and 5xx responses
+            retry_base_delay: Delay before the first retry in seconds; doubles per retry
+            retry_max_delay: Upper bound for the exponential delay in seconds
+            retry_jitter: Extra random fraction of the delay added to each wait
+            cache_size: Maximum number of cached ``validate()`` results
+            cache_ttl: Seconds to reuse a ``validate()`` result for the same
+                email and options; caching is disabled when None
+            health_cache_ttl: Seconds to reuse a ``health()`` response for;
+                0 disables it
+        """
+        if httpx is None:
+            raise ImportError(
+                "HttpxAsyncEmailValidator requires httpx; "
+                "install it with 'pip install email-validator-sdk[http2]'"
+            )
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries,
+            retry_base_delay=retry_base_delay,
+            retry_max_delay=retry_max_delay,
+            retry_jitter=retry_jitter,
+            cache_size=cache_size,
+            cache_ttl=cache_ttl,
+            health_cache_ttl=health_cache_ttl,
+        )
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        )
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    async def _open(self) -> None:
+        """Create the httpx client."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=self._limits,
+                timeout=self.timeout.total,
+                headers=self._headers(),
+            )
+
+    async def _close(self) -> None:
+        """Close the httpx client."""
+        if self._client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> Tuple[int, Mapping[str, str], bytes]:
+        """Send one request and return its status, headers and raw body."""
+        if not self._client:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        # Raw bodies go in httpx's content=; data= is deprecated for bytes
+        if "data" in kwargs:
+            kwargs["content"] = kwargs.pop("data")
+        response = await self._client.request(method, url, **kwargs)
+        return response.status_code, response.headers, response.content
@@ -0,0 +1,34 @@
+"""
+Event loop helpers for AsyncEmailValidator workloads
+"""
+
+import asyncio
+
+
+def install_fast_loop() -> bool:
+    """
+    Make new event loops use uvloop (winloop on Windows) when it is installed.
+
+    Call this before ``asyncio.run()``; it has no effect on a loop that is
+    already running. A custom event loop policy set by the application is
+    left alone.
+
+    Returns:
+        True if a fast event loop policy is active afterwards
+    """
+    try:
+        import uvloop as fast_loop
+    except ImportError:
+        try:
+            import winloop as fast_loop
+        except ImportError:
+            return False
+
+    policy = asyncio.get_event_loop_policy()
+    if isinstance(policy, fast_loop.EventLoopPolicy):
+        return True
+    if type(policy) is not asyncio.DefaultEventLoopPolicy:
+        return False
+
+    asyncio.set_event_loop_policy(fast_loop.EventLoopPolicy())
+    return True
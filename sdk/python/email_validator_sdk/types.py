@@ -2,13 +2,22 @@
 Type definitions for Email Validator SDK
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Callable, Sequence, Tuple
 
+from .utils import json_dumps
 
-@dataclass
+# Slotted dataclasses need Python 3.10; older versions get regular ones
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+_EMPTY: Dict[str, Any] = {}
+
+
+@dataclass(frozen=True, **_DATACLASS_OPTIONS)
 class ValidateOptions:
-    """Options for email validation"""
+    """Options for email validation (immutable, so it can be cached on)"""
     smtp_check: bool = False
     auth_check: bool = False
     reputation_check: bool = False
@@ -16,62 +25,112 @@ class ValidateOptions:
     webhook_url: Optional[str] = None
 
 
-@dataclass
+@lru_cache(maxsize=32)
+def _options_payload(options: ValidateOptions) -> Tuple[Tuple[str, bool], ...]:
+    """Request fields for the enabled checks of ``options``"""
+    flags = (
+        ("smtpCheck", options.smtp_check),
+        ("authCheck", options.auth_check),
+        ("reputationCheck", options.reputation_check),
+        ("gravatarCheck", options.gravatar_check),
+    )
+    return tuple((key, True) for key, enabled in flags if enabled)
+
+
+@lru_cache(maxsize=32)
+def _options_body_suffix(options: Optional[ValidateOptions]) -> bytes:
+    """Encoded option fields that close a ``{"email": ...`` request body"""
+    flags = json_dumps(dict(_options_payload(options))) if options is not None else b"{}"
+    return b"}" if flags == b"{}" else b"," + flags[1:]
+
+
+def _validate_body(email: str, options: Optional[ValidateOptions]) -> bytes:
+    """
+    Encode the ``/api/validate`` request body.
+
+    Only the email is serialized per call; the option fields are encoded
+    once per ``options`` value and appended.
+    """
+    return b'{"email":' + json_dumps(email) + _options_body_suffix(options)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class SyntaxCheck:
     valid: bool
     message: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DomainCheck:
     valid: bool
     exists: bool
     message: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class MxCheck:
     valid: bool
     records: List[str]
     message: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class DisposableCheck:
     is_disposable: bool
     message: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RoleBasedCheck:
     is_role_based: bool
     role: Optional[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FreeProviderCheck:
     is_free: bool
     provider: Optional[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TypoCheck:
     has_typo: bool
     suggestion: Optional[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BlacklistCheck:
     is_blacklisted: bool
     lists: List[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CatchAllCheck:
     is_catch_all: bool
 
 
-@dataclass
+def _none() -> None:
+    """Default factory for optional check fields"""
+    return None
+
+
+# How each check is read from the response, in ValidationChecks field order:
+# (response key, check class, ((response field, default factory), ...)) with
+# the fields listed in the check class's own field order.
+_CHECK_SPECS: Tuple[Tuple[str, Any, Tuple[Tuple[str, Callable[[], Any]], ...]], ...] = (
+    ("syntax", SyntaxCheck, (("valid", bool), ("message", str))),
+    ("domain", DomainCheck, (("valid", bool), ("exists", bool), ("message", str))),
+    ("mx", MxCheck, (("valid", bool), ("records", list), ("message", str))),
+    ("disposable", DisposableCheck, (("isDisposable", bool), ("message", str))),
+    ("roleBased", RoleBasedCheck, (("isRoleBased", bool), ("role", _none))),
+    ("freeProvider", FreeProviderCheck, (("isFree", bool), ("provider", _none))),
+    ("typo", TypoCheck, (("hasTypo", bool), ("suggestion", _none))),
+    ("blacklisted", BlacklistCheck, (("isBlacklisted", bool), ("lists", list))),
+    ("catchAll", CatchAllCheck, (("isCatchAll", bool),)),
+)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationChecks:
     syntax: SyntaxCheck
     domain: DomainCheck
@@ -88,7 +147,7 @@ class ValidationChecks:
     gravatar: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     """Result of email validation"""
     email: str
@@ -102,35 +161,15 @@ class ValidationResult:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ValidationResult":
         """Create ValidationResult from API response dictionary"""
-        checks_data = data.get("checks", {})
+        checks_data = data.get("checks") or _EMPTY
+
+        parsed = []
+        for key, check_cls, fields in _CHECK_SPECS:
+            section = checks_data.get(key) or _EMPTY
+            parsed.append(check_cls(*[section.get(src) or default() for src, default in fields]))
 
         checks = ValidationChecks(
-            syntax=SyntaxCheck(**checks_data.get("syntax", {"valid": False, "message": ""})),
-            domain=DomainCheck(**checks_data.get("domain", {"valid": False, "exists": False, "message": ""})),
-            mx=MxCheck(**checks_data.get("mx", {"valid": False, "records": [], "message": ""})),
-            disposable=DisposableCheck(
-                is_disposable=checks_data.get("disposable", {}).get("isDisposable", False),
-                message=checks_data.get("disposable", {}).get("message", "")
-            ),
-            role_based=RoleBasedCheck(
-                is_role_based=checks_data.get("roleBased", {}).get("isRoleBased", False),
-                role=checks_data.get("roleBased", {}).get("role")
-            ),
-            free_provider=FreeProviderCheck(
-                is_free=checks_data.get("freeProvider", {}).get("isFree", False),
-                provider=checks_data.get("freeProvider", {}).get("provider")
-            ),
-            typo=TypoCheck(
-                has_typo=checks_data.get("typo", {}).get("hasTypo", False),
-                suggestion=checks_data.get("typo", {}).get("suggestion")
-            ),
-            blacklisted=BlacklistCheck(
-                is_blacklisted=checks_data.get("blacklisted", {}).get("isBlacklisted", False),
-                lists=checks_data.get("blacklisted", {}).get("lists", [])
-            ),
-            catch_all=CatchAllCheck(
-                is_catch_all=checks_data.get("catchAll", {}).get("isCatchAll", False)
-            ),
+            *parsed,
             smtp=checks_data.get("smtp"),
             authentication=checks_data.get("authentication"),
             reputation=checks_data.get("reputation"),
@@ -148,7 +187,7 @@ class ValidationResult:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BulkValidationMetadata:
     total: int
     completed: int
@@ -158,7 +197,7 @@ class BulkValidationMetadata:
     processing_time_ms: int
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BulkValidationResult:
     """Result of bulk email validation"""
     results: List[ValidationResult]
@@ -167,11 +206,10 @@ class BulkValidationResult:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BulkValidationResult":
         """Create BulkValidationResult from API response dictionary"""
-        results = [
-            ValidationResult.from_dict(r) for r in data.get("results", [])
-        ]
+        from_dict = ValidationResult.from_dict
+        results = [from_dict(r) for r in data.get("results") or ()]
 
-        meta = data.get("metadata", {})
+        meta = data.get("metadata") or _EMPTY
         metadata = BulkValidationMetadata(
             total=meta.get("total", 0),
             completed=meta.get("completed", 0),
@@ -182,3 +220,23 @@ class BulkValidationResult:
         )
 
         return cls(results=results, metadata=metadata)
+
+    @classmethod
+    def merge(cls, parts: Sequence["BulkValidationResult"]) -> "BulkValidationResult":
+        """Combine the results of several bulk requests, keeping their order"""
+        results: List[ValidationResult] = []
+        for part in parts:
+            results.extend(part.results)
+
+        metas = [part.metadata for part in parts]
+        metadata = BulkValidationMetadata(
+            total=sum(m.total for m in metas),
+            completed=sum(m.completed for m in metas),
+            duplicates_removed=sum(m.duplicates_removed for m in metas),
+            invalid_removed=sum(m.invalid_removed for m in metas),
+            timed_out=any(m.timed_out for m in metas),
+            # Chunks run concurrently, so the slowest one bounds the total
+            processing_time_ms=max((m.processing_time_ms for m in metas), default=0),
+        )
+
+        return cls(results=results, metadata=metadata)
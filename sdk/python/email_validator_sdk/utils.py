@@ -0,0 +1,170 @@
+"""
+Helpers shared by the sync and async clients
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+VERSION = "1.0.0"
+
+# requests, aiohttp and httpx all decode brotli when one of these is installed;
+# only ask for it then, since an undecodable body would be unusable
+_HAS_BROTLI = any(find_spec(name) is not None for name in ("brotli", "brotlicffi"))
+
+# Sent with every request; the API key is added per client
+DEFAULT_HEADERS = {
+    "Content-Type": "application/json",
+    "User-Agent": f"EmailValidator-Python-SDK/{VERSION}",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate, br" if _HAS_BROTLI else "gzip, deflate",
+}
+
+EMAIL_RE = re.compile(r"\A[^@\s]+@[^@\s]+\.[^@\s]+\Z")
+
+# Characters matched by ``\s`` within the ASCII range
+_ASCII_WS = frozenset(" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+
+# Most emails the API accepts in one bulk request
+MAX_BULK_SIZE = 1000
+
+# Statuses worth retrying: rate limiting and transient server failures
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Statuses whose Retry-After header is honored
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+def build_headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """Build the full set of headers for a client in one go."""
+    if api_key:
+        return {**DEFAULT_HEADERS, "X-API-Key": api_key}
+    return dict(DEFAULT_HEADERS)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given as delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float, jitter: float) -> float:
+    """
+    Exponential backoff with jitter for the given (zero-based) attempt.
+
+    The exponential part is capped at ``max_delay`` and then stretched by up
+    to ``jitter`` so that concurrent clients do not retry in lockstep.
+    """
+    return min(max_delay, base_delay * (2 ** attempt)) * (1 + random.random() * jitter)
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Serialize a request payload to JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Deserialize a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def is_valid_email(email: str) -> bool:
+    """
+    Check that ``email`` looks like an address, exactly as :data:`EMAIL_RE` does.
+
+    ASCII input, the common case, is checked with plain string scans that
+    are cheaper than running the regex; anything else uses the regex so
+    Unicode whitespace is handled identically.
+    """
+    if not email.isascii():
+        return EMAIL_RE.match(email) is not None
+    at = email.find("@")
+    if at <= 0 or email.find("@", at + 1) != -1:
+        return False
+    # The domain needs a dot with at least one character on each side
+    if "." not in email[at + 2 : -1]:
+        return False
+    return _ASCII_WS.isdisjoint(email)
+
+
+def prepare_bulk_emails(emails: List[Any]) -> Tuple[List[str], int, int]:
+    """
+    Clean bulk input the way the API does before sending it.
+
+    Addresses are trimmed and lower-cased, entries that are not strings or do
+    not look like an email are dropped, and duplicates are removed keeping
+    the first occurrence.
+
+    Returns:
+        Tuple of (emails to send, duplicates removed, invalid removed)
+    """
+    valid = [
+        e
+        for e in (raw.strip().lower() for raw in emails if isinstance(raw, str))
+        if is_valid_email(e)
+    ]
+    unique = list(dict.fromkeys(valid))
+    return unique, len(valid) - len(unique), len(emails) - len(valid)
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -26,9 +26,23 @@ setup(
         "aiohttp>=3.8.0",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9",
+            "brotli>=1.0",
+            "uvloop>=0.19; platform_system != 'Windows'",
+            "winloop>=0.1; platform_system == 'Windows'",
+        ],
+        "stream": [
+            "ijson>=3.1",
+        ],
+        "http2": [
+            "httpx[http2]>=0.27",
+        ],
         "dev": [
             "pytest>=7.0.0",
             "pytest-asyncio>=0.20.0",
+            "responses>=0.23.0",
+            "aioresponses>=0.7.0",
         ],
     },
 )
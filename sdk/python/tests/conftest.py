@@ -0,0 +1,47 @@
+"""Shared fixtures for the SDK tests."""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def validation_response():
+    """Canonical /api/validate response body for a deliverable address."""
+    return {
+        "email": "test@example.com",
+        "isValid": True,
+        "score": 95,
+        "deliverability": "deliverable",
+        "risk": "low",
+        "checks": {
+            "syntax": {"valid": True, "message": "Valid syntax"},
+            "domain": {"valid": True, "exists": True, "message": "Domain exists"},
+            "mx": {"valid": True, "records": ["mx.example.com"], "message": "MX found"},
+            "disposable": {"isDisposable": False, "message": "Not disposable"},
+            "roleBased": {"isRoleBased": False, "role": None},
+            "freeProvider": {"isFree": False, "provider": None},
+            "typo": {"hasTypo": False, "suggestion": None},
+            "blacklisted": {"isBlacklisted": False, "lists": []},
+            "catchAll": {"isCatchAll": False},
+        },
+        "timestamp": "2024-01-01T00:00:00Z",
+    }
+
+
+@pytest.fixture
+def bulk_response(validation_response):
+    """Build a /api/validate-bulk response body for the given emails."""
+
+    def build(emails):
+        return {
+            "results": [{**validation_response, "email": e} for e in emails],
+            "metadata": {
+                "total": len(emails),
+                "completed": len(emails),
+                "duplicatesRemoved": 0,
+                "invalidRemoved": 0,
+                "timedOut": False,
+                "processingTimeMs": 12,
+            },
+        }
+
+    return build
@@ -0,0 +1,255 @@
+"""Tests for the asynchronous client."""
+
+import json
+
+import pytest
+import pytest_asyncio
+from aioresponses import aioresponses
+
+from email_validator_sdk import (
+    APIError,
+    AsyncEmailValidator,
+    AuthenticationError,
+    RateLimitError,
+    ValidateOptions,
+    ValidationError,
+    ValidationResult,
+    async_client,
+    close_default_connector,
+)
+
+BASE_URL = "http://localhost:3000"
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def default_connector():
+    """Release the module-wide pool opened on each test's event loop."""
+    yield
+    await close_default_connector()
+
+
+@pytest.fixture
+def mock_api():
+    with aioresponses() as m:
+        yield m
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry waits instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(async_client.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _client(**kwargs):
+    return AsyncEmailValidator(base_url=BASE_URL, retry_base_delay=0, retry_jitter=0, **kwargs)
+
+
+def _request_count(mock_api):
+    return sum(len(calls) for calls in mock_api.requests.values())
+
+
+class TestRetry:
+    @pytest.mark.asyncio
+    async def test_retries_server_error_then_succeeds(self, mock_api, sleeps, validation_response):
+        mock_api.post(f"{BASE_URL}/api/validate", status=502)
+        mock_api.post(f"{BASE_URL}/api/validate", payload=validation_response)
+
+        async with _client() as client:
+            result = await client.validate("test@example.com")
+
+        assert result.is_valid is True
+        assert _request_count(mock_api) == 2
+        assert sleeps == [0]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_waits_for_retry_after(self, mock_api, sleeps, validation_response):
+        mock_api.post(f"{BASE_URL}/api/validate", status=429, headers={"Retry-After": "1"})
+        mock_api.post(f"{BASE_URL}/api/validate", payload=validation_response)
+
+        async with _client() as client:
+            await client.validate("test@example.com")
+
+        assert _request_count(mock_api) == 2
+        assert sleeps == [1.0]
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_beyond_max_delay_raises(self, mock_api, sleeps):
+        mock_api.post(f"{BASE_URL}/api/validate", status=429, headers={"Retry-After": "120"})
+
+        async with _client() as client:
+            with pytest.raises(RateLimitError) as exc_info:
+                await client.validate("test@example.com")
+
+        assert exc_info.value.retry_after == 120.0
+        assert _request_count(mock_api) == 1
+        assert sleeps == []
+
+    @pytest.mark.asyncio
+    async def test_unauthorized_is_not_retried(self, mock_api, sleeps):
+        mock_api.post(f"{BASE_URL}/api/validate", status=401, payload={"error": "Invalid API key"})
+
+        async with _client() as client:
+            with pytest.raises(AuthenticationError) as exc_info:
+                await client.validate("test@example.com")
+
+        assert exc_info.value.message == "Invalid API key"
+        assert _request_count(mock_api) == 1
+
+    @pytest.mark.asyncio
+    async def test_final_retry_failure_raises(self, mock_api, sleeps):
+        mock_api.post(
+            f"{BASE_URL}/api/validate",
+            status=503,
+            payload={"error": "Service unavailable"},
+            repeat=True,
+        )
+
+        async with _client(max_retries=2) as client:
+            with pytest.raises(APIError) as exc_info:
+                await client.validate("test@example.com")
+
+        assert exc_info.value.status_code == 503
+        assert _request_count(mock_api) == 3
+        assert len(sleeps) == 2
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_nested_context_shares_one_session(self, mock_api, validation_response):
+        mock_api.post(f"{BASE_URL}/api/validate", payload=validation_response, repeat=True)
+        client = _client()
+
+        async with client:
+            session = client._session
+            async with client:
+                assert client._session is session
+            # The inner exit must leave the outer block's session usable
+            assert not session.closed
+            await client.validate("test@example.com")
+
+        assert session.closed
+        assert client._session is None
+
+    @pytest.mark.asyncio
+    async def test_default_connector_is_shared(self):
+        async with _client() as first, _client() as second:
+            assert first._session.connector is second._session.connector
+
+        connector = async_client.get_default_connector()
+        assert not connector.closed
+        await close_default_connector()
+        assert connector.closed
+
+
+class TestPreChecks:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "email", ["", None, "not-an-email"], ids=["empty", "none", "malformed"]
+    )
+    async def test_bad_email_is_rejected_without_a_request(self, mock_api, email):
+        async with _client() as client:
+            with pytest.raises(ValidationError):
+                await client.validate(email)
+
+        assert _request_count(mock_api) == 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "emails", [[], [f"user{i}@example.com" for i in range(1001)]], ids=["empty", "too-many"]
+    )
+    async def test_bad_bulk_list_is_rejected_without_a_request(self, mock_api, emails):
+        async with _client() as client:
+            with pytest.raises(ValidationError):
+                await client.validate_bulk(emails)
+
+        assert _request_count(mock_api) == 0
+
+
+class TestValidateCache:
+    @pytest.mark.asyncio
+    async def test_cache_is_keyed_on_lowercased_email_and_options(
+        self, mock_api, validation_response
+    ):
+        mock_api.post(f"{BASE_URL}/api/validate", payload=validation_response, repeat=True)
+
+        async with _client(cache_ttl=60) as client:
+            first = await client.validate("Test@Example.com")
+            assert await client.validate("test@example.com") == first
+            assert _request_count(mock_api) == 1
+
+            await client.validate("test@example.com", ValidateOptions(smtp_check=True))
+            assert _request_count(mock_api) == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_are_independent_copies(self, mock_api, validation_response):
+        mock_api.post(f"{BASE_URL}/api/validate", payload=validation_response)
+
+        async with _client(cache_ttl=60) as client:
+            first = await client.validate("test@example.com")
+            first.checks.mx.records.append("evil.example.com")
+            second = await client.validate("test@example.com")
+
+        assert second == ValidationResult.from_dict(validation_response)
+        assert second.checks.mx.records is not first.checks.mx.records
+
+    @pytest.mark.asyncio
+    async def test_webhook_requests_bypass_cache(self, mock_api, validation_response):
+        mock_api.post(f"{BASE_URL}/api/validate", payload=validation_response, repeat=True)
+        options = ValidateOptions(webhook_url="https://hooks.example.com/done")
+
+        async with _client(cache_ttl=60) as client:
+            await client.validate("test@example.com", options)
+            await client.validate("test@example.com", options)
+
+        assert _request_count(mock_api) == 2
+
+
+class TestValidateBulkParallel:
+    @pytest.mark.asyncio
+    async def test_chunks_are_merged_in_order(self, mock_api, bulk_response):
+        emails = [f"user{i}@example.com" for i in range(5)]
+        mock_api.post(f"{BASE_URL}/api/validate-bulk", payload=bulk_response(emails[:2]))
+        mock_api.post(f"{BASE_URL}/api/validate-bulk", payload=bulk_response(emails[2:4]))
+        mock_api.post(f"{BASE_URL}/api/validate-bulk", payload=bulk_response(emails[4:]))
+
+        async with _client() as client:
+            result = await client.validate_bulk_parallel(
+                emails + ["USER0@example.com", "bad"], chunk_size=2, concurrency=1
+            )
+
+        bodies = [
+            json.loads(call.kwargs["data"]) for call in next(iter(mock_api.requests.values()))
+        ]
+        assert bodies == [{"emails": emails[:2]}, {"emails": emails[2:4]}, {"emails": emails[4:]}]
+        assert [r.email for r in result.results] == emails
+        assert result.metadata.total == 5
+        assert result.metadata.duplicates_removed == 1
+        assert result.metadata.invalid_removed == 1
+
+
+class TestHealth:
+    @pytest.mark.asyncio
+    async def test_health_is_cached_and_copied(self, mock_api):
+        mock_api.get(f"{BASE_URL}/api/health", payload={"status": "ok"}, repeat=True)
+
+        async with _client(health_cache_ttl=5.0) as client:
+            (await client.health())["status"] = "mutated"
+            assert await client.health() == {"status": "ok"}
+
+        assert _request_count(mock_api) == 1
+
+    @pytest.mark.asyncio
+    async def test_health_cache_disabled(self, mock_api):
+        mock_api.get(f"{BASE_URL}/api/health", payload={"status": "ok"}, repeat=True)
+
+        async with _client(health_cache_ttl=0) as client:
+            await client.health()
+            await client.health()
+
+        assert _request_count(mock_api) == 2
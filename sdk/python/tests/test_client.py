@@ -0,0 +1,384 @@
+"""Tests for the synchronous client."""
+
+import io
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import responses
+from requests.adapters import HTTPAdapter
+
+from email_validator_sdk import (
+    APIError,
+    AuthenticationError,
+    BulkValidationResult,
+    EmailValidator,
+    RateLimitError,
+    ValidateOptions,
+    ValidationError,
+    ValidationResult,
+)
+from email_validator_sdk import client as client_module
+
+BASE_URL = "http://localhost:3000"
+
+
+@pytest.fixture
+def validator():
+    return EmailValidator(
+        api_key="test-key",
+        base_url=BASE_URL,
+        retry_base_delay=0,
+        retry_jitter=0,
+    )
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry waits instead of sleeping."""
+    delays = []
+    monkeypatch.setattr("email_validator_sdk.client.time.sleep", delays.append)
+    return delays
+
+
+class _HealthHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.peers.add(self.client_address)
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def health_server(monkeypatch):
+    """Local keep-alive HTTP server that records each client connection."""
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _HealthHandler)
+    server.peers = set()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestRetry:
+    @responses.activate
+    def test_retries_server_error_then_succeeds(self, validator, sleeps, validation_response):
+        responses.add(responses.POST, f"{BASE_URL}/api/validate", status=502)
+        responses.add(
+            responses.POST, f"{BASE_URL}/api/validate", json=validation_response, status=200
+        )
+
+        result = validator.validate("test@example.com")
+
+        assert result.is_valid is True
+        assert len(responses.calls) == 2
+        assert sleeps == [0]
+
+    @responses.activate
+    def test_rate_limit_waits_for_retry_after(self, validator, sleeps, validation_response):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/validate",
+            status=429,
+            headers={"Retry-After": "1"},
+        )
+        responses.add(
+            responses.POST, f"{BASE_URL}/api/validate", json=validation_response, status=200
+        )
+
+        result = validator.validate("test@example.com")
+
+        assert result.email == "test@example.com"
+        assert len(responses.calls) == 2
+        assert sleeps == [1.0]
+
+    @responses.activate
+    def test_rate_limit_beyond_max_delay_raises(self, validator, sleeps):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/validate",
+            status=429,
+            headers={"Retry-After": "120"},
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            validator.validate("test@example.com")
+
+        assert exc_info.value.retry_after == 120.0
+        assert len(responses.calls) == 1
+        assert sleeps == []
+
+    @responses.activate
+    def test_unauthorized_is_not_retried(self, validator, sleeps):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/validate",
+            json={"error": "Invalid API key"},
+            status=401,
+        )
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            validator.validate("test@example.com")
+
+        assert exc_info.value.message == "Invalid API key"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_final_retry_failure_raises(self, sleeps):
+        validator = EmailValidator(
+            base_url=BASE_URL, max_retries=2, retry_base_delay=0, retry_jitter=0
+        )
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/validate",
+            json={"error": "Service unavailable"},
+            status=503,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            validator.validate("test@example.com")
+
+        assert exc_info.value.status_code == 503
+        assert exc_info.value.message == "Service unavailable"
+        assert len(responses.calls) == 3
+        assert len(sleeps) == 2
+
+
+class TestConnectionPool:
+    def test_pooled_adapter_is_mounted(self):
+        validator = EmailValidator(base_url=BASE_URL, pool_size=8)
+
+        adapter = validator.session.get_adapter(BASE_URL)
+
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter is validator.session.get_adapter("https://example.com")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 8
+        assert adapter.poolmanager.connection_pool_kw["block"] is True
+        assert adapter.max_retries.total == 0
+
+    def test_requests_reuse_one_connection(self, health_server):
+        host, port = health_server.server_address
+        with EmailValidator(base_url=f"http://{host}:{port}", health_cache_ttl=0) as validator:
+            for _ in range(3):
+                assert validator.health() == {"status": "ok"}
+
+        assert len(health_server.peers) == 1
+
+
+class TestPreChecks:
+    @pytest.mark.parametrize(
+        "email", ["", None, "not-an-email"], ids=["empty", "none", "malformed"]
+    )
+    @responses.activate
+    def test_bad_email_is_rejected_without_a_request(self, validator, email):
+        with pytest.raises(ValidationError):
+            validator.validate(email)
+
+        assert len(responses.calls) == 0
+
+    @responses.activate
+    def test_empty_bulk_list_is_rejected_without_a_request(self, validator):
+        with pytest.raises(ValidationError):
+            validator.validate_bulk([])
+
+        assert len(responses.calls) == 0
+
+
+class TestValidateCache:
+    @responses.activate
+    def test_cache_is_keyed_on_lowercased_email_and_options(self, validation_response):
+        validator = EmailValidator(base_url=BASE_URL, cache_ttl=60)
+        responses.add(
+            responses.POST, f"{BASE_URL}/api/validate", json=validation_response, status=200
+        )
+
+        first = validator.validate("Test@Example.com")
+        assert validator.validate("test@example.com") == first
+        assert len(responses.calls) == 1
+
+        validator.validate("test@example.com", ValidateOptions(smtp_check=True))
+        assert len(responses.calls) == 2
+        assert json.loads(responses.calls[1].request.body) == {
+            "email": "test@example.com",
+            "smtpCheck": True,
+        }
+
+    @responses.activate
+    def test_cache_hits_are_independent_copies(self, validation_response):
+        validator = EmailValidator(base_url=BASE_URL, cache_ttl=60)
+        responses.add(
+            responses.POST, f"{BASE_URL}/api/validate", json=validation_response, status=200
+        )
+
+        first = validator.validate("test@example.com")
+        first.score = 0
+        first.checks.mx.records.append("evil.example.com")
+        second = validator.validate("test@example.com")
+
+        assert second == ValidationResult.from_dict(validation_response)
+        assert second.checks.mx.records is not first.checks.mx.records
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_webhook_requests_bypass_cache(self, validation_response):
+        validator = EmailValidator(base_url=BASE_URL, cache_ttl=60)
+        responses.add(
+            responses.POST, f"{BASE_URL}/api/validate", json=validation_response, status=200
+        )
+        options = ValidateOptions(webhook_url="https://hooks.example.com/done")
+
+        validator.validate("test@example.com", options)
+        validator.validate("test@example.com", options)
+
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_cache_clear(self, validation_response):
+        validator = EmailValidator(base_url=BASE_URL, cache_ttl=60)
+        responses.add(
+            responses.POST, f"{BASE_URL}/api/validate", json=validation_response, status=200
+        )
+
+        validator.validate("test@example.com")
+        validator.cache_clear()
+        validator.validate("test@example.com")
+
+        assert len(responses.calls) == 2
+
+
+class TestValidateBulk:
+    @responses.activate
+    def test_input_is_cleaned_and_counted(self, validator, bulk_response):
+        responses.add(
+            responses.POST,
+            f"{BASE_URL}/api/validate-bulk",
+            json=bulk_response(["a@example.com", "b@example.com"]),
+            status=200,
+        )
+
+        result = validator.validate_bulk(
+            [" A@example.com", "a@example.com", "b@example.com", "not-an-email", None]
+        )
+
+        assert json.loads(responses.calls[0].request.body) == {
+            "emails": ["a@example.com", "b@example.com"]
+        }
+        assert [r.email for r in result.results] == ["a@example.com", "b@example.com"]
+        assert result.metadata.duplicates_removed == 1
+        assert result.metadata.invalid_removed == 2
+
+    @responses.activate
+    def test_nothing_left_to_send_skips_request(self, validator):
+        result = validator.validate_bulk(["not-an-email", "also bad"])
+
+        assert len(responses.calls) == 0
+        assert result.results == []
+        assert result.metadata.invalid_removed == 2
+
+    @responses.activate
+    def test_too_many_emails(self, validator):
+        emails = [f"user{i}@example.com" for i in range(1001)]
+
+        with pytest.raises(ValidationError):
+            validator.validate_bulk(emails)
+
+        assert len(responses.calls) == 0
+
+
+@pytest.mark.skipif(client_module.ijson is None, reason="ijson is not installed")
+class TestStreamBulk:
+    @pytest.fixture
+    def body(self, validation_response):
+        checks = validation_response["checks"]
+        results = []
+        for i in range(60):
+            results.append(
+                {
+                    **validation_response,
+                    "email": f"user{i}@example.com",
+                    "isValid": i % 3 != 0,
+                    "score": i,
+                    "deliverability": "risky" if i % 3 == 0 else "deliverable",
+                    "checks": {
+                        **checks,
+                        "mx": {
+                            "valid": True,
+                            "records": [f"mx{n}.example.com" for n in range(i % 4)],
+                            "message": "MX found",
+                        },
+                        "blacklisted": {"isBlacklisted": i % 5 == 0, "lists": ["spamhaus"]},
+                        "smtp": {"valid": True, "responses": [{"code": 250, "delay": 0.5}]},
+                    },
+                }
+            )
+        metadata = {
+            "total": 62,
+            "completed": 60,
+            "duplicatesRemoved": 1,
+            "invalidRemoved": 1,
+            "timedOut": True,
+            "processingTimeMs": 1234,
+        }
+        return json.dumps({"results": results, "metadata": metadata}).encode()
+
+    def test_stream_matches_full_parse(self, body):
+        streamed = client_module._stream_bulk(io.BytesIO(body))
+
+        assert len(streamed.results) == 60
+        assert streamed == BulkValidationResult.from_dict(json.loads(body))
+
+    @responses.activate
+    def test_large_bulk_response_is_streamed(self, validator, body, monkeypatch):
+        responses.add(responses.POST, f"{BASE_URL}/api/validate-bulk", body=body, status=200)
+        streamed = []
+
+        def spy(raw):
+            streamed.append(raw)
+            return stream_bulk(raw)
+
+        stream_bulk = client_module._stream_bulk
+        monkeypatch.setattr(client_module, "_stream_bulk", spy)
+
+        result = validator.validate_bulk([f"user{i}@example.com" for i in range(60)])
+
+        assert len(streamed) == 1
+        assert result == BulkValidationResult.from_dict(json.loads(body))
+
+
+class TestHealth:
+    @responses.activate
+    def test_health_is_cached_for_ttl(self, monkeypatch):
+        validator = EmailValidator(base_url=BASE_URL, health_cache_ttl=5.0)
+        responses.add(responses.GET, f"{BASE_URL}/api/health", json={"status": "ok"}, status=200)
+        now = [100.0]
+        monkeypatch.setattr("email_validator_sdk.client.time.monotonic", lambda: now[0])
+
+        validator.health()
+        now[0] += 4.9
+        validator.health()
+        assert len(responses.calls) == 1
+
+        now[0] += 0.2
+        validator.health()
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_health_returns_copies(self):
+        validator = EmailValidator(base_url=BASE_URL)
+        responses.add(responses.GET, f"{BASE_URL}/api/health", json={"status": "ok"}, status=200)
+
+        validator.health()["status"] = "mutated"
+
+        assert validator.health() == {"status": "ok"}
+        assert len(responses.calls) == 1
@@ -0,0 +1,141 @@
+"""Tests for the HTTP/2 (httpx) client."""
+
+import importlib
+import json
+import sys
+import warnings
+
+import pytest
+
+from email_validator_sdk import async_client, httpx_client
+
+httpx = pytest.importorskip("httpx")
+
+BASE_URL = "http://localhost:3000"
+
+
+class _MockAPI:
+    """Answer requests with queued handlers; the last one keeps answering."""
+
+    def __init__(self):
+        self.requests = []
+        self.handlers = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        handler = self.handlers.pop(0) if len(self.handlers) > 1 else self.handlers[0]
+        return handler(request)
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Route the client's httpx traffic through a MockTransport."""
+    mock = _MockAPI()
+    real_client = httpx.AsyncClient
+
+    def client(**kwargs):
+        return real_client(transport=httpx.MockTransport(mock), **kwargs)
+
+    monkeypatch.setattr(httpx_client.httpx, "AsyncClient", client)
+    return mock
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record retry waits instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(async_client.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _client(**kwargs):
+    return httpx_client.HttpxAsyncEmailValidator(
+        base_url=BASE_URL, retry_base_delay=0, retry_jitter=0, **kwargs
+    )
+
+
+class TestLifecycle:
+    @pytest.mark.asyncio
+    async def test_client_is_opened_and_closed(self, api):
+        client = _client(api_key="test-key", timeout=7)
+
+        async with client:
+            inner = client._client
+            assert inner is not None
+            assert inner.headers["X-API-Key"] == "test-key"
+            assert inner.timeout.read == 7
+
+        assert inner.is_closed
+        assert client._client is None
+
+    @pytest.mark.asyncio
+    async def test_send_requires_context_manager(self):
+        with pytest.raises(RuntimeError):
+            await _client().health()
+
+
+class TestRequests:
+    @pytest.mark.asyncio
+    async def test_bodies_are_sent_as_content(self, api, validation_response, bulk_response):
+        api.handlers.append(lambda request: httpx.Response(200, json=validation_response))
+        api.handlers.append(
+            lambda request: httpx.Response(200, json=bulk_response(["a@example.com"]))
+        )
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            async with _client() as client:
+                result = await client.validate("test@example.com")
+                bulk = await client.validate_bulk(["a@example.com"])
+
+        assert result.is_valid is True
+        assert [r.email for r in bulk.results] == ["a@example.com"]
+        assert json.loads(api.requests[0].content) == {"email": "test@example.com"}
+        assert json.loads(api.requests[1].content) == {"emails": ["a@example.com"]}
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_are_retried(self, api, sleeps):
+        def fail(request):
+            raise httpx.ConnectError("connection refused", request=request)
+
+        api.handlers.append(fail)
+        api.handlers.append(lambda request: httpx.Response(200, json={"status": "ok"}))
+
+        async with _client() as client:
+            assert await client.health() == {"status": "ok"}
+
+        assert len(api.requests) == 2
+        assert sleeps == [0]
+
+    @pytest.mark.asyncio
+    async def test_transport_error_is_raised_after_last_retry(self, api, sleeps):
+        def fail(request):
+            raise httpx.ReadTimeout("timed out", request=request)
+
+        api.handlers.append(fail)
+
+        async with _client(max_retries=1) as client:
+            with pytest.raises(httpx.ReadTimeout):
+                await client.health()
+
+        assert len(api.requests) == 2
+
+    def test_transport_error_is_the_retry_exception(self):
+        assert httpx_client.HttpxAsyncEmailValidator._RETRY_EXCEPTIONS == (httpx.TransportError,)
+
+
+def test_requires_httpx(monkeypatch):
+    monkeypatch.setitem(sys.modules, "httpx", None)
+    module = importlib.reload(httpx_client)
+    try:
+        # The empty fallback is never used: construction fails first
+        assert module.HttpxAsyncEmailValidator._RETRY_EXCEPTIONS == ()
+        with pytest.raises(ImportError):
+            module.HttpxAsyncEmailValidator()
+    finally:
+        monkeypatch.undo()
+        importlib.reload(httpx_client)
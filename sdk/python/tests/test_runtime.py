@@ -0,0 +1,76 @@
+"""Tests for the event loop helpers."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from email_validator_sdk.runtime import install_fast_loop
+
+
+class _FastPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+class _CustomPolicy(asyncio.DefaultEventLoopPolicy):
+    pass
+
+
+@pytest.fixture(autouse=True)
+def restore_policy():
+    """Put back whatever policy the test started with."""
+    policy = asyncio.get_event_loop_policy()
+    yield
+    asyncio.set_event_loop_policy(policy)
+
+
+@pytest.fixture
+def default_policy():
+    policy = asyncio.DefaultEventLoopPolicy()
+    asyncio.set_event_loop_policy(policy)
+    return policy
+
+
+def _install_fake(monkeypatch, name):
+    """Make ``import <name>`` return a module with an EventLoopPolicy."""
+    module = types.ModuleType(name)
+    module.EventLoopPolicy = _FastPolicy
+    monkeypatch.setitem(sys.modules, name, module)
+
+
+@pytest.fixture
+def no_fast_loops(monkeypatch):
+    monkeypatch.setitem(sys.modules, "uvloop", None)
+    monkeypatch.setitem(sys.modules, "winloop", None)
+
+
+def test_returns_false_without_a_fast_loop(no_fast_loops, default_policy):
+    assert install_fast_loop() is False
+    assert asyncio.get_event_loop_policy() is default_policy
+
+
+@pytest.mark.parametrize("name", ["uvloop", "winloop"])
+def test_replaces_the_default_policy(monkeypatch, no_fast_loops, default_policy, name):
+    _install_fake(monkeypatch, name)
+
+    assert install_fast_loop() is True
+    assert isinstance(asyncio.get_event_loop_policy(), _FastPolicy)
+
+
+def test_keeps_an_existing_fast_policy(monkeypatch, no_fast_loops):
+    _install_fake(monkeypatch, "uvloop")
+    policy = _FastPolicy()
+    asyncio.set_event_loop_policy(policy)
+
+    assert install_fast_loop() is True
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_leaves_a_custom_policy_alone(monkeypatch, no_fast_loops):
+    _install_fake(monkeypatch, "uvloop")
+    policy = _CustomPolicy()
+    asyncio.set_event_loop_policy(policy)
+
+    assert install_fast_loop() is False
+    assert asyncio.get_event_loop_policy() is policy
@@ -0,0 +1,51 @@
+"""Tests for response types."""
+
+from email_validator_sdk import BulkValidationResult, ValidationResult
+
+
+class TestValidationResult:
+    def test_from_dict(self, validation_response):
+        result = ValidationResult.from_dict(validation_response)
+
+        assert result.is_valid is True
+        assert result.score == 95
+        assert result.checks.mx.records == ["mx.example.com"]
+        assert result.checks.free_provider.is_free is False
+        assert result.checks.smtp is None
+
+    def test_from_dict_defaults_missing_checks(self):
+        result = ValidationResult.from_dict({"email": "a@example.com"})
+
+        assert result.is_valid is False
+        assert result.deliverability == "unknown"
+        assert result.checks.syntax.message == ""
+        assert result.checks.blacklisted.lists == []
+
+
+class TestBulkValidationResultMerge:
+    def test_merge_keeps_order_and_combines_metadata(self, bulk_response):
+        first = BulkValidationResult.from_dict(bulk_response(["a@example.com", "b@example.com"]))
+        second = BulkValidationResult.from_dict(bulk_response(["c@example.com"]))
+        second.metadata.timed_out = True
+        second.metadata.processing_time_ms = 40
+        second.metadata.invalid_removed = 1
+
+        merged = BulkValidationResult.merge([first, second])
+
+        assert [r.email for r in merged.results] == [
+            "a@example.com",
+            "b@example.com",
+            "c@example.com",
+        ]
+        assert merged.metadata.total == 3
+        assert merged.metadata.completed == 3
+        assert merged.metadata.invalid_removed == 1
+        assert merged.metadata.timed_out is True
+        assert merged.metadata.processing_time_ms == 40
+
+    def test_merge_nothing(self):
+        merged = BulkValidationResult.merge([])
+
+        assert merged.results == []
+        assert merged.metadata.total == 0
+        assert merged.metadata.processing_time_ms == 0
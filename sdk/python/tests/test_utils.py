@@ -0,0 +1,64 @@
+"""Tests for utility helpers."""
+
+from email_validator_sdk.utils import (
+    TTLCache,
+    backoff_delay,
+    parse_retry_after,
+    prepare_bulk_emails,
+)
+
+
+class TestPrepareBulkEmails:
+    def test_counts_duplicates_and_invalid(self):
+        emails, duplicates, invalid = prepare_bulk_emails(
+            ["A@example.com ", "a@example.com", "b@example.com", "nope", 42, "B@EXAMPLE.COM"]
+        )
+
+        assert emails == ["a@example.com", "b@example.com"]
+        assert duplicates == 2
+        assert invalid == 2
+
+    def test_clean_input_is_unchanged(self):
+        assert prepare_bulk_emails(["a@example.com", "b@example.com"]) == (
+            ["a@example.com", "b@example.com"],
+            0,
+            0,
+        )
+
+
+class TestRetryHelpers:
+    def test_parse_retry_after_seconds(self):
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after("-5") == 0.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_backoff_delay_is_capped(self):
+        assert backoff_delay(0, 1.0, 30.0, 0) == 1.0
+        assert backoff_delay(3, 1.0, 30.0, 0) == 8.0
+        assert backoff_delay(10, 1.0, 30.0, 0) == 30.0
+
+
+class TestTTLCache:
+    def test_entries_expire(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr("email_validator_sdk.utils.time.monotonic", lambda: now[0])
+        cache = TTLCache(maxsize=10, ttl=5.0)
+
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        now[0] = 5.0
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2, ttl=60.0)
+
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3